@@ -2,6 +2,7 @@ import asyncio
 import os
 import time
 import warnings
+from collections.abc import Awaitable
 
 from src.cleaning.__main__ import main as cleaning_main
 from src.core_courses.__main__ import main as core_courses_main
@@ -52,38 +53,54 @@ def create_markdown_table_and_details(data_dict, warnings):
     return "".join(result)
 
 
-def main():
-    result = {}
+async def run_parser(category: str, parser_main: Awaitable[dict | None]) -> dict | None:
+    """
+    Run one parser, logging its start and finish, as logs of parsers running together interleave
 
-    logger.info("\nCore Courses:")
+    :param category: category name of the parser
+    :param parser_main: parser main coroutine
+    :return: parsed data
+    """
+    logger.info(f"{category}: started")
     try:
-        if parsed_data := asyncio.run(core_courses_main()):
-            result["Core Courses"] = parsed_data
-    except Exception as e:
-        logger.error(f"Failed to parse Core Courses: {e}", exc_info=True)
+        return await parser_main
+    finally:
+        logger.info(f"{category}: finished")
+
+
+async def run_parsers() -> dict:
+    """
+    Run all parsers, they are independent, so they run concurrently: async parsers take turns at their network
+    requests, and the synchronous cleaning parser runs in a thread alongside them.
+
+    :return: parsed data by category, failed parsers are logged and skipped
+    """
+    parser_mains = {
+        "Core Courses": core_courses_main(),
+        "Electives": electives_main(),
+        "Sports": sports_main(),
+        "Cleaning": asyncio.to_thread(cleaning_main),
+    }
+    categories = tuple(parser_mains)
+    logger.info(f"Running parsers: {', '.join(categories)}")
+    results = await asyncio.gather(
+        *(run_parser(category, parser_main) for category, parser_main in parser_mains.items()),
+        return_exceptions=True,
+    )
 
-    logger.info("\nElectives:")
-    try:
-        if parsed_data := asyncio.run(electives_main()):
-            result["Electives"] = parsed_data
-    except Exception as e:
-        logger.error(f"Failed to parse Electives: {e}", exc_info=True)
-
-    logger.info("\nSports:")
-    try:
-        if parsed_data := asyncio.run(sports_main()):
-            result["Sports"] = parsed_data
-    except Exception as e:
-        logger.error(f"Failed to parse Sports: {e}", exc_info=True)
+    result = {}
+    for category, parsed_data in zip(categories, results):
+        if isinstance(parsed_data, Exception):
+            logger.error(f"Failed to parse {category}: {parsed_data}", exc_info=parsed_data)
+        elif isinstance(parsed_data, BaseException):
+            raise parsed_data
+        elif parsed_data:
+            result[category] = parsed_data
+    return result
 
-    logger.info("\nCleaning:")
-    try:
-        if parsed_data := cleaning_main():
-            result["Cleaning"] = parsed_data
-    except Exception as e:
-        logger.error(f"Failed to parse Cleaning: {e}", exc_info=True)
 
-    return result
+def main():
+    return asyncio.run(run_parsers())
 
 
 if __name__ == "__main__":
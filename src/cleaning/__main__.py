@@ -2,21 +2,23 @@ import asyncio
 import json
 import os
 from collections.abc import Iterable
-from itertools import groupby
 from pathlib import Path
 
+import icalendar
+
 from src.cleaning.config import CleaningParserConfig
 from src.cleaning.parser import CleaningEvent, CleaningParser, LinenChangeEvent
-from src.config_base import SaveConfig, from_yaml
+from src.config_base import SaveConfig, load_yaml
 from src.innohassle import CreateEventGroup, CreateTag, InNoHassleEventsClient, Output, update_inh_event_groups
 from src.logging_ import logger
-from src.utils import get_base_calendar, sluggify
+from src.utils import get_base_calendar, group_by, sluggify, write_calendars
 
 
 def main():
     config_path = Path(__file__).parent / "config.yaml"
-    parser_config = from_yaml(CleaningParserConfig, config_path)
-    save_config = from_yaml(SaveConfig, config_path)
+    yaml_config = load_yaml(config_path)
+    parser_config = CleaningParserConfig.model_validate(yaml_config)
+    save_config = SaveConfig.model_validate(yaml_config)
     parser = CleaningParser(parser_config)
 
     cleaning_tag = CreateTag(alias="cleaning", name="Cleaning", type="category")
@@ -26,13 +28,13 @@ def main():
     directory = save_config.save_ics_path
     tags = [cleaning_tag, cleaning_cleaning_tag, linen_change_tag]
     event_groups = []
+    calendars_to_write: list[tuple[Path, icalendar.Calendar]] = []
 
     # ----- Cleaning schedule -----
-    cleaning_events = parser.get_cleaning_events()
-    cleaning_events = sorted(cleaning_events, key=lambda x: x.location)
+    cleaning_events_by_location = group_by(lambda x: x.location, parser.get_cleaning_events())
     course_path = Path()
     course_path.mkdir(parents=True, exist_ok=True)
-    for location, cleaning_events_group in groupby(cleaning_events, key=lambda x: x.location):
+    for location, cleaning_events_group in sorted(cleaning_events_by_location.items()):
         cleaning_events_group: Iterable[CleaningEvent]
         calendar = get_base_calendar()
         calendar["x-wr-calname"] = f"Cleaning: {location}"
@@ -49,9 +51,7 @@ def main():
         logger.info(f"> Writing {file_path}")
 
         os.makedirs(file_path.parent, exist_ok=True)
-        with open(file_path, "wb") as f:
-            content = calendar.to_ical()
-            f.write(content)
+        calendars_to_write.append((file_path, calendar))
 
         event_groups.append(
             CreateEventGroup(
@@ -63,10 +63,9 @@ def main():
             )
         )
     # ----- Linen change -----
-    linen_change_events = parser.get_linen_change_schedule()
-    linen_change_events = sorted(linen_change_events, key=lambda x: x.location)
+    linen_change_events_by_location = group_by(lambda x: x.location, parser.get_linen_change_schedule())
 
-    for location, linen_change_events_group in groupby(linen_change_events, key=lambda x: x.location):
+    for location, linen_change_events_group in sorted(linen_change_events_by_location.items()):
         linen_change_events_group: Iterable[LinenChangeEvent]
 
         calendar = get_base_calendar()
@@ -81,9 +80,7 @@ def main():
         logger.info(f"> Writing {file_path}")
 
         os.makedirs(file_path.parent, exist_ok=True)
-        with open(file_path, "wb") as f:
-            content = calendar.to_ical()
-            f.write(content)
+        calendars_to_write.append((file_path, calendar))
 
         event_groups.append(
             CreateEventGroup(
@@ -95,12 +92,14 @@ def main():
             )
         )
 
+    write_calendars(calendars_to_write)
+
     # --- Writing JSON file and InNoHassle integration -
     logger.info(f"Writing JSON file... {len(event_groups)} event groups.")
     output = Output(event_groups=event_groups, tags=tags)
     # create a new .json file with information about calendar
     with open(save_config.save_json_path, "w") as f:
-        json.dump(output.model_dump(), f, indent=2, sort_keys=False, ensure_ascii=False)
+        f.write(json.dumps(output.model_dump(), indent=2, sort_keys=False, ensure_ascii=False))
 
     # InNoHassle integration
     if save_config.innohassle_api_url is None or save_config.parser_auth_key is None:
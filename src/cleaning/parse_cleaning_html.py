@@ -12,6 +12,11 @@ from dateutil import relativedelta
 
 from src.logging_ import logger
 
+# 7 корпус 1-7 этажи 7 building 1-7 floors
+# 2 корпус 3-4 этаж 2 building 3-4 floor
+# 3 корпус 3 building
+BUILDING_PATTERN = re.compile(r"(?P<building>\d)\s+building(\s+(?P<floors>(\d+|\d+-\d+))\s+floors?)?")
+
 
 def process_dataframe(df: pd.DataFrame, entries: dict[str, list[date]]) -> None:
     # drop columns that contain only NaN
@@ -76,26 +81,21 @@ def process_dataframe(df: pd.DataFrame, entries: dict[str, list[date]]) -> None:
     days_as_dates.extend([current_month_date.replace(day=day) for day in cur])
     days_as_dates.extend([next_month_date.replace(day=day) for day in next])
 
-    # flatten df
-    df = df.values.flatten()
-    # create new Series with dates as index
-    series = pd.Series(df, index=pd.to_datetime(days_as_dates))
-    # drop Nans
-    series = series.dropna()
-    for index, value in series.items():
-        # 7 корпус 1-7 этажи 7 building 1-7 floors
-        # 2 корпус 3-4 этаж 2 building 3-4 floor
-        # 3 корпус 3 building
-        matches = re.finditer(r"(?P<building>\d)\s+building(\s+(?P<floors>(\d+|\d+-\d+))\s+floors?)?", value)
-        for m in matches:
+    # flatten df and pair every cell with its date, no need for a datetime-indexed Series
+    for date_, value in zip(days_as_dates, df.to_numpy().flatten().tolist(), strict=True):
+        # skip Nans
+        if pd.isna(value):
+            continue
+        for m in BUILDING_PATTERN.finditer(value):
             building = m.group("building")
             floors = m.group("floors")
             if floors:
                 key = f"{building} building {floors} floors"
             else:
                 key = f"{building} building"
-            entries[key].append(index.date())
-            logger.debug(f"{key}, {index.date()}")
+            entries[key].append(date_)
+            # called for every matched cell, let logging format it only if debug is enabled
+            logger.debug("%s, %s", key, date_)
 
 
 def parse(dfs: dict[str, pd.DataFrame]) -> dict[str, list[date]]:
@@ -1,16 +1,18 @@
-__all__ = ["SaveConfig"]
+__all__ = ["SaveConfig", "load_yaml"]
 
 from pathlib import Path
 
 import yaml
 from pydantic import BaseModel, ConfigDict, SecretStr, field_validator
 
+# libyaml-based loader is much faster on large configs (e.g. electives list), fallback to pure python one
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
-def from_yaml[T: BaseModel](cls: type[T], path: Path) -> T:
-    "Load config from yaml file"
+
+def load_yaml(path: Path) -> dict:
+    "Load raw config from yaml file, so that several configs can be validated from one read"
     with open(path) as f:
-        yaml_config = yaml.safe_load(f)
-    return cls.model_validate(yaml_config)
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 class SaveConfig(BaseModel):
@@ -2,25 +2,27 @@ import asyncio
 import datetime
 import json
 import os
+from collections import defaultdict
 from collections.abc import Generator
-from itertools import groupby
 from pathlib import Path
 
+import icalendar
 import pandas as pd
 
-from src.config_base import SaveConfig, from_yaml
+from src.config_base import SaveConfig, load_yaml
 from src.core_courses.cell_to_event import CoreCourseEvent, convert_cell_to_event
 from src.core_courses.config import CoreCoursesConfig, Target
 from src.core_courses.event_to_ical import generate_vevents
 from src.core_courses.parser import CoreCourseCell, CoreCoursesParser
 from src.innohassle import CreateEventGroup, CreateTag, InNoHassleEventsClient, Output, update_inh_event_groups
 from src.logging_ import logger
-from src.utils import fetch_xlsx_spreadsheet, get_base_calendar, get_sheet_gids, sluggify
+from src.utils import fetch_xlsx_spreadsheet, get_base_calendar, get_sheet_gids, sluggify, write_calendars
 
 
 def use(
     processed_column: pd.Series,
     target: Target,
+    index: list[tuple[str, tuple[datetime.time, datetime.time]]] | None = None,
 ) -> Generator[CoreCourseEvent, None, None]:
     """
     Generate events from processed cells
@@ -28,6 +30,7 @@ def use(
     :param processed_column: series with processed cells (CoreCourseCell),
         multiindex with (weekday, timeslot) and (course, group) as name
     :param target: target to generate events for (needed for start and end dates)
+    :param index: (weekday, timeslot) index as plain list, computed from the column if not given
     :return: generator of events
     """
     # -------- Iterate over processed cells --------
@@ -35,7 +38,10 @@ def use(
     course: str
     group: str
 
-    for (weekday, timeslot), cell in processed_column.items():
+    if index is None:
+        index = processed_column.index.tolist()
+    # plain lists of index tuples and cells, Series.items() boxes every MultiIndex entry through pandas
+    for (weekday, timeslot), cell in zip(index, processed_column.tolist()):
         cell: CoreCourseCell | None
         if cell is None:
             continue
@@ -59,11 +65,15 @@ def use(
 
 async def main():
     config_path = Path(__file__).parent / "config.yaml"
-    parser_config = from_yaml(CoreCoursesConfig, config_path)
-    save_config = from_yaml(SaveConfig, config_path)
+    yaml_config = load_yaml(config_path)
+    parser_config = CoreCoursesConfig.model_validate(yaml_config)
+    save_config = SaveConfig.model_validate(yaml_config)
     parser = CoreCoursesParser()
-    xlsx_file = await fetch_xlsx_spreadsheet(spreadsheet_id=parser_config.spreadsheet_id)
-    sheet_gids = await get_sheet_gids(parser_config.spreadsheet_id)
+    # xlsx export already contains all target sheets, fetch it together with sheet gids
+    xlsx_file, sheet_gids = await asyncio.gather(
+        fetch_xlsx_spreadsheet(spreadsheet_id=parser_config.spreadsheet_id),
+        get_sheet_gids(parser_config.spreadsheet_id),
+    )
     logger.debug(f"Found sheet gids: {sheet_gids}")
 
     original_target_sheet_names = [target.sheet_name for target in parser_config.targets]
@@ -75,17 +85,25 @@ async def main():
     )
 
     # -------- Generate events from processed cells --------
-    events: list[CoreCourseEvent] = []
+    ignored_subjects = frozenset(parser_config.ignored_subjects)
+    events_by_group: dict[tuple[str, str], list[CoreCourseEvent]] = defaultdict(list)
     for target, grouped_dfs_with_cells_list in zip(parser_config.targets, pipeline_result):
         for grouped_dfs_with_cells in grouped_dfs_with_cells_list:
-            series_with_generators = grouped_dfs_with_cells.apply(use, target=target)
+            # all columns share the (weekday, timeslot) index, convert it to a list once per dataframe
+            index = grouped_dfs_with_cells.index.tolist()
+            series_with_generators = grouped_dfs_with_cells.apply(use, target=target, index=index)
             for generator in series_with_generators:
                 generator: Generator[CoreCourseEvent, None, None]
-                events.extend(generator)
+                for event in generator:
+                    # the group keeps its (possibly empty) calendar even if all its subjects are ignored
+                    group_events = events_by_group[(event.course, event.group)]
+                    if event.subject in ignored_subjects:
+                        logger.debug(f"> Ignoring {event.subject}")
+                        continue
+                    group_events.append(event)
 
     predefined_event_groups: list[CreateEventGroup] = []
 
-    events.sort(key=lambda x: (x.course, x.group))
     directory = save_config.save_ics_path
     academic_tag = CreateTag(
         alias="core-courses",
@@ -102,7 +120,8 @@ async def main():
     logger.info(f"> Mount point: {save_config.mount_point}")
 
     tags = [academic_tag, semester_tag]
-    for (course, group), group_events in groupby(events, lambda x: (x.course, x.group)):
+    calendars_to_write: list[tuple[Path, icalendar.Calendar]] = []
+    for (course, group), group_events in sorted(events_by_group.items()):
         course_slug = sluggify(course)
         course_tag = CreateTag(
             alias=course_slug,
@@ -115,12 +134,8 @@ async def main():
         group_calendar["x-wr-calname"] = group
         group_calendar["x-wr-link"] = f"https://docs.google.com/spreadsheets/d/{parser_config.spreadsheet_id}"
 
-        group_events = list(group_events)  # noqa: PLW2901
         cnt = 0
         for group_event in group_events:
-            if group_event.subject in parser_config.ignored_subjects:
-                logger.debug(f"> Ignoring {group_event.subject}")
-                continue
             group_event: CoreCourseEvent
 
             group_vevents = generate_vevents(group_event)
@@ -139,10 +154,7 @@ async def main():
         logger.info(f"> Writing {file_path}")
 
         os.makedirs(file_path.parent, exist_ok=True)
-        with open(file_path, "wb") as f:
-            content = group_calendar.to_ical()
-            # TODO: add validation
-            f.write(content)
+        calendars_to_write.append((file_path, group_calendar))
 
         predefined_event_groups.append(
             CreateEventGroup(
@@ -158,11 +170,13 @@ async def main():
             )
         )
 
+    write_calendars(calendars_to_write)
+
     logger.info(f"Writing JSON file... {len(predefined_event_groups)} event groups.")
     output = Output(event_groups=predefined_event_groups, tags=tags)
     # create a new .json file with information about calendar
     with open(save_config.save_json_path, "w") as f:
-        json.dump(output.model_dump(), f, indent=2, sort_keys=False, ensure_ascii=False)
+        f.write(json.dumps(output.model_dump(), indent=2, sort_keys=False, ensure_ascii=False))
 
     # InNoHassle integration
     if save_config.innohassle_api_url is None or save_config.parser_auth_key is None:
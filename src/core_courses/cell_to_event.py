@@ -5,7 +5,9 @@ https://github.com/one-zero-eight/schedule-builder-backend/blob/main/src/core_co
 """
 
 import datetime
+import functools
 import re
+import sys
 import warnings
 from typing import Literal
 
@@ -18,6 +20,16 @@ from .config import Target
 from .location_parser import Item, parse_location_string
 from .parser import CoreCourseCell
 
+BRACKETS_PATTERN = re.compile(r"\((.+?)\)")
+CLASS_TYPE_PATTERN = re.compile(r"^(?:lec|tut|lab|тут|лек|лаб)$", flags=re.IGNORECASE)
+COLON_PATTERN = re.compile(r"\s*:\s*")
+TEACHER_SEPARATOR_PATTERN = re.compile(r"\s*[,/]\s*")
+REPEATING_COMMAS_PATTERN = re.compile(r"(,\s*)+,")
+TRAILING_COMMA_PATTERN = re.compile(r"\s*,\s*$")
+AND_PATTERN = re.compile(r"\s+AND\s+")
+PHYSICAL_EDUCATION_PATTERN = re.compile(r"ELECTIVE COURSES? ON PHYSICAL EDUCATION")
+GROUP_STUDENT_NUMBER_PATTERN = re.compile(r"(?:\(|\s)(G\d+|\d+)\)?\s*$")
+
 
 class CoreCourseEvent(BaseModel):
     model_config = ConfigDict(coerce_numbers_to_str=True)
@@ -79,22 +91,9 @@ class CoreCourseEvent(BaseModel):
         - "Analytical Geometry and Linear Algebra I" -> "Analytical Geometry and Linear Algebra I"
         """
 
-        subject = self.subject
-        matches = re.finditer(r"\((.+?)\)", subject)
-        for match in matches:
-            inside_brackets = match.group(1)
-
-            if re.match(r"^(?:lec|tut|lab|тут|лек|лаб)$", inside_brackets, flags=re.IGNORECASE):
-                # if inside_brackets is "lec" or "tut" or "lab" then it is class type
-                subject = subject.replace(match[0], "", 1)
-                self.class_type = inside_brackets.lower()  # type: ignore
-            else:
-                # if inside_brackets is not "lec" or "tut" or "lab" then it is part of subject
-                subject = subject.replace(match[0], f": {inside_brackets.strip()}", 1)
-
-        # remove whitespaces before colons(:)
-        subject = re.sub(r"\s*:\s*", ": ", subject)
-        subject = remove_repeating_spaces_and_trailing_spaces(subject)
+        subject, class_type = split_subject_and_class_type(self.subject)
+        if class_type is not None:
+            self.class_type = class_type  # type: ignore
         self.subject = subject
 
     def process_teacher(self):
@@ -111,14 +110,15 @@ class CoreCourseEvent(BaseModel):
 
         teacher = self.teacher
         # remove spaces before and after commas(,) and slashes(/) and replace them with comma(,)
-        teacher = re.sub(r"\s*[,/]\s*", ",", teacher)
+        teacher = TEACHER_SEPARATOR_PATTERN.sub(",", teacher)
         # remove multiple commas in a row
-        teacher = re.sub(r"(,\s*)+,", ",", teacher)
+        teacher = REPEATING_COMMAS_PATTERN.sub(",", teacher)
         # remove trailing commas
-        teacher = re.sub(r"\s*,\s*$", "", teacher)
+        teacher = TRAILING_COMMA_PATTERN.sub("", teacher)
         # remove trailing spaces
         teacher = teacher.strip()
-        self.teacher = teacher
+        # same teachers repeat in every week and group, share one string object
+        self.teacher = sys.intern(teacher)
 
     def process_location(self):
         """
@@ -130,10 +130,10 @@ class CoreCourseEvent(BaseModel):
         # Upper case location
         location = location.upper()
         # replace " and " with comma
-        location = re.sub(r"\s+AND\s+", ", ", location)
-        self.location = location
+        location = AND_PATTERN.sub(", ", location)
+        self.location = location = sys.intern(location)
 
-        if not re.match(r"ELECTIVE COURSES? ON PHYSICAL EDUCATION", location):  # no need to parse this location
+        if not PHYSICAL_EDUCATION_PATTERN.match(location):  # no need to parse this location
             self.location_item = parse_location_string(location)
 
             if self.location_item is None:
@@ -144,6 +144,55 @@ class CoreCourseEvent(BaseModel):
         return f"[{self.course} / {self.group} | {self.subject} {timeslot} | {self.original_value[-1]}]"
 
 
+@functools.cache
+def split_subject_and_class_type(subject: str) -> tuple[str, str | None]:
+    """
+    Split subject string into subject and class type, cached as the same subject repeats across weeks and groups
+
+    :param subject: raw subject string
+    :return: processed subject and class type if present
+    """
+    class_type = None
+    matches = BRACKETS_PATTERN.finditer(subject)
+    for match in matches:
+        inside_brackets = match.group(1)
+
+        if CLASS_TYPE_PATTERN.match(inside_brackets):
+            # if inside_brackets is "lec" or "tut" or "lab" then it is class type
+            subject = subject.replace(match[0], "", 1)
+            class_type = inside_brackets.lower()
+        else:
+            # if inside_brackets is not "lec" or "tut" or "lab" then it is part of subject
+            subject = subject.replace(match[0], f": {inside_brackets.strip()}", 1)
+
+    # remove whitespaces before colons(:)
+    subject = COLON_PATTERN.sub(": ", subject)
+    subject = remove_repeating_spaces_and_trailing_spaces(subject)
+    return subject, class_type
+
+
+@functools.cache
+def preprocess_group(value: str) -> tuple[str, int | None]:
+    """
+    Process group name, cached as the same group header repeats for every cell in its column
+
+    - "M21-DS(16)" -> "M21-DS"
+    - "M22-TE-01 (10)" -> "M22-TE-01"
+    - "B20-SD-02 (29)" -> "B20-SD-02"
+    - "M25-RO-01" -> "M25-RO-01" (trailing group number is not a student number)
+    """
+    student_number = None
+    # Match (G\d+) or (\d+) at the end, bracket or whitespace is required before the number
+    if student_number_m := GROUP_STUDENT_NUMBER_PATTERN.search(value):
+        match_text = student_number_m.group(1)
+        if match_text.startswith("G"):
+            student_number = int(match_text[1:])
+        else:
+            student_number = int(match_text)
+        value = value[: student_number_m.start()].strip()
+    return value, student_number
+
+
 def convert_cell_to_event(
     cell: CoreCourseCell,
     weekday: str,
@@ -172,25 +221,6 @@ def convert_cell_to_event(
         starts = target.start_date
         ends = target.end_date
 
-        def preprocess_group(value: str) -> tuple[str, int | None]:
-            """
-            Process group name
-
-            - "M21-DS(16)" -> "M21-DS"
-            - "M22-TE-01 (10)" -> "M22-TE-01"
-            - "B20-SD-02 (29)" -> "B20-SD-02"
-            """
-            student_number = None
-            # Match (G\d+) or (\d+) at the end
-            if student_number_m := re.search(r"\(?(G\d+|\d+)\)?\s*$", value):
-                match_text = student_number_m.group(1)
-                if match_text.startswith("G"):
-                    student_number = int(match_text[1:])
-                else:
-                    student_number = int(match_text)
-                value = value.replace(student_number_m.group(0), "").strip()
-            return value, student_number
-
         group, group_student_number = preprocess_group(group)
 
         if target.override is not None:
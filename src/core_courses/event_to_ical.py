@@ -1,4 +1,5 @@
 import datetime
+import functools
 import warnings
 from collections.abc import Generator
 from datetime import UTC
@@ -13,15 +14,49 @@ from .cell_to_event import CoreCourseEvent
 from .location_parser import Item
 
 
-def every_week_rule(event: CoreCourseEvent, *, ends: datetime.date | None = None) -> icalendar.vRecur:
+@functools.cache
+def weekly_rule_until(ends: datetime.date) -> icalendar.vRecur:
     """
-    Set recurrence rule and recurrence date for event
+    Weekly recurrence rule until the given date, built once and shared by all events with the same end date
     """
-    until = datetime.datetime.combine(ends or event.ends, datetime.time.min).astimezone(UTC)
+    until = datetime.datetime.combine(ends, datetime.time.min).astimezone(UTC)
     rrule = icalendar.vRecur({"WKST": "MO", "FREQ": "WEEKLY", "INTERVAL": 1, "UNTIL": until})
     return rrule
 
 
+def every_week_rule(event: CoreCourseEvent, *, ends: datetime.date | None = None) -> icalendar.vRecur:
+    """
+    Set recurrence rule and recurrence date for event
+    """
+    return weekly_rule_until(ends or event.ends)
+
+
+@functools.cache
+def get_dtstamp(dtstamp: datetime.datetime) -> icalendar.vDatetime:
+    """
+    Timestamp property, built once as all events of a target share the same dtstamp
+    """
+    return icalendar.vDatetime(dtstamp)
+
+
+@functools.cache
+def get_local_vdatetime(dt: datetime.datetime) -> icalendar.vDatetime:
+    """
+    Moscow time property, shared by all events starting or ending at the same moment (e.g. same timeslot in all groups)
+    """
+    return icalendar.vDatetime(dt)
+
+
+def set_properties(vevent: icalendar.Event, mapping: dict) -> None:
+    """
+    Set non-empty properties of the event. Plain strings are wrapped in vText as vevent.add would do,
+    other values are already encoded, so the per-call checks and type lookup of vevent.add are skipped
+    """
+    for key, value in mapping.items():
+        if value:
+            vevent[key] = icalendar.vText(value) if type(value) is str else value
+
+
 def get_event_hash(event: CoreCourseEvent) -> int:
     string_to_hash = str(
         (
@@ -38,14 +73,17 @@ def get_event_hash(event: CoreCourseEvent) -> int:
     return crc32(string_to_hash.encode("utf-8"))
 
 
-def get_uid(event: CoreCourseEvent, sequence: str = "x") -> str:
+def get_uid(event: CoreCourseEvent, sequence: str = "x", event_hash: int | None = None) -> str:
     """
     Get unique identifier for the event
 
+    :param event_hash: precomputed hash of the event, computed if not given
     :return: unique identifier
     :rtype: str
     """
-    return sequence + f"-{abs(get_event_hash(event)):x}@innohassle.ru"
+    if event_hash is None:
+        event_hash = get_event_hash(event)
+    return sequence + f"-{abs(event_hash):x}@innohassle.ru"
 
 
 def get_summary(event: CoreCourseEvent) -> str:
@@ -53,18 +91,18 @@ def get_summary(event: CoreCourseEvent) -> str:
 
 
 def get_description(event: CoreCourseEvent) -> str | None:
-    r = {
-        # "Location": event.location,
-        "Instructor": event.teacher,
-        # "Type": event.class_type,
-        "Group": event.group,
-        "Course": event.course,
-        # "Subject": event.subject,
-    }
+    r = (
+        # ("Location", event.location),
+        ("Instructor", event.teacher),
+        # ("Type", event.class_type),
+        ("Group", event.group),
+        ("Course", event.course),
+        # ("Subject", event.subject),
+    )
 
-    r = {k: v for k, v in r.items() if v}
-    if r:
-        return "\n".join([f"{k}: {v}" for k, v in r.items()])
+    lines = [f"{k}: {v}" for k, v in r if v]
+    if lines:
+        return "\n".join(lines)
     return None
 
 
@@ -76,6 +114,8 @@ def generate_vevents(event: CoreCourseEvent) -> Generator[icalendar.Event, None,
     :return: icalendar events if "only on xx/xx, xx/xx" appeared in location, else one icalendar event
     """
 
+    # uids of all produced vevents differ only in sequence, so hash the event once
+    event_hash = get_event_hash(event)
     xwr_link = f"https://docs.google.com/spreadsheets/d/{event.spreadsheet_id}?gid={event.google_sheet_gid}#gid={event.google_sheet_gid}&range={event.a1}"
     if not event.location_item:
         start_of_weekdays = nearest_weekday(event.starts, event.weekday)
@@ -85,18 +125,17 @@ def generate_vevents(event: CoreCourseEvent) -> Generator[icalendar.Event, None,
             "summary": get_summary(event),
             "description": get_description(event),
             "location": event.location,
-            "dtstamp": icalendar.vDatetime(event.dtstamp),
-            "uid": get_uid(event),
+            "dtstamp": get_dtstamp(event.dtstamp),
+            "uid": get_uid(event, event_hash=event_hash),
             "color": get_color(event.subject),
-            "rrule": every_week_rule(event),
-            "dtstart": icalendar.vDatetime(dtstart),
-            "dtend": icalendar.vDatetime(dtend),
+            "dtstart": get_local_vdatetime(dtstart),
+            "dtend": get_local_vdatetime(dtend),
             "x-wr-link": xwr_link,
         }
         vevent = icalendar.Event()
-        for key, value in mapping.items():
-            if value:
-                vevent.add(key, value)
+        set_properties(vevent, mapping)
+        # shared vRecur is already encoded, no need to go through vevent.add
+        vevent["rrule"] = every_week_rule(event)
         yield vevent
         return
 
@@ -152,17 +191,15 @@ def generate_vevents(event: CoreCourseEvent) -> Generator[icalendar.Event, None,
         "summary": get_summary(event),
         "description": get_description(event),
         "location": location,
-        "dtstamp": icalendar.vDatetime(event.dtstamp),
-        "uid": get_uid(event),
+        "dtstamp": get_dtstamp(event.dtstamp),
+        "uid": get_uid(event, event_hash=event_hash),
         "color": get_color(event.subject),
         "x-wr-link": xwr_link,
     }
 
     vevent = icalendar.Event()
 
-    for key, value in mapping.items():
-        if value:
-            vevent.add(key, value)
+    set_properties(vevent, mapping)
 
     if location_item.on:  # only on specific dates, not every week
         rdates = [dtstart.replace(day=on.day, month=on.month) for on in location_item.on if starts <= on <= ends]
@@ -174,10 +211,10 @@ def generate_vevents(event: CoreCourseEvent) -> Generator[icalendar.Event, None,
         dtstart = rdates[0]
         dtend = dtend.replace(day=dtstart.day, month=dtstart.month)
     else:  # every week at the same time
-        vevent.add("rrule", every_week_rule(event, ends=ends))
+        vevent["rrule"] = every_week_rule(event, ends=ends)
 
-    vevent["dtstart"] = icalendar.vDatetime(dtstart)
-    vevent["dtend"] = icalendar.vDatetime(dtend)
+    vevent["dtstart"] = get_local_vdatetime(dtstart)
+    vevent["dtend"] = get_local_vdatetime(dtend)
 
     # check for item.except_ and add exdate if needed
     if location_item.except_:
@@ -216,24 +253,24 @@ def generate_vevents(event: CoreCourseEvent) -> Generator[icalendar.Event, None,
                 seq += 1
                 vevent_copy = vevent.copy()
                 _recurrence_id = dtstart.replace(day=on.day, month=on.month)
-                vevent_copy["recurrence-id"] = icalendar.vDatetime(_recurrence_id)
+                vevent_copy["recurrence-id"] = get_local_vdatetime(_recurrence_id)
                 vevent_copy["sequence"] = seq
                 vevent_copy.pop("rrule")
                 # adapt dtstart and dtend
                 _dtstart = dtstart.replace(day=on.day, month=on.month)
                 _dtend = dtend.replace(day=on.day, month=on.month)
-                vevent_copy["dtstart"] = icalendar.vDatetime(_dtstart)
-                vevent_copy["dtend"] = icalendar.vDatetime(_dtend)
+                vevent_copy["dtstart"] = get_local_vdatetime(_dtstart)
+                vevent_copy["dtend"] = get_local_vdatetime(_dtend)
                 if item.location:
                     vevent_copy["location"] = item.location
                 if item.starts_at:
                     _dtstart = _dtstart.replace(hour=item.starts_at.hour, minute=item.starts_at.minute)
                     _dtend = _dtstart + duration
-                    vevent_copy["dtstart"] = icalendar.vDatetime(_dtstart)
-                    vevent_copy["dtend"] = icalendar.vDatetime(_dtend)
+                    vevent_copy["dtstart"] = get_local_vdatetime(_dtstart)
+                    vevent_copy["dtend"] = get_local_vdatetime(_dtend)
                 if item.till:
                     _dtend = _dtend.replace(hour=item.till.hour, minute=item.till.minute)
-                    vevent_copy["dtend"] = icalendar.vDatetime(_dtend)
+                    vevent_copy["dtend"] = get_local_vdatetime(_dtend)
                 yield vevent_copy
         yield vevent
     else:  # just a single event on specific dates
@@ -241,7 +278,7 @@ def generate_vevents(event: CoreCourseEvent) -> Generator[icalendar.Event, None,
 
         for i, item in enumerate(nested_on):
             vevent_copy = vevent.copy()
-            vevent_copy["uid"] = get_uid(event, sequence=str(i))
+            vevent_copy["uid"] = get_uid(event, sequence=str(i), event_hash=event_hash)
             vevent_copy.pop("rdate")
             item_starts = clamp_starts(item.starts_from, starts)
             item_ends = clamp_ends(item.ends_on, ends)
@@ -252,17 +289,17 @@ def generate_vevents(event: CoreCourseEvent) -> Generator[icalendar.Event, None,
             # adapt dtstart and dtend
             _dtstart = rdates[0]
             _dtend = dtend.replace(day=_dtstart.day, month=_dtstart.month)
-            vevent_copy["dtstart"] = icalendar.vDatetime(_dtstart)
-            vevent_copy["dtend"] = icalendar.vDatetime(_dtend)
+            vevent_copy["dtstart"] = get_local_vdatetime(_dtstart)
+            vevent_copy["dtend"] = get_local_vdatetime(_dtend)
             if item.location:
                 vevent_copy["location"] = item.location
             if item.starts_at:
                 _dtstart = _dtstart.replace(hour=item.starts_at.hour, minute=item.starts_at.minute)
                 _dtend = _dtstart + duration
-                vevent_copy["dtstart"] = icalendar.vDatetime(_dtstart)
-                vevent_copy["dtend"] = icalendar.vDatetime(_dtend)
+                vevent_copy["dtstart"] = get_local_vdatetime(_dtstart)
+                vevent_copy["dtend"] = get_local_vdatetime(_dtend)
             if item.till:
                 _dtend = _dtend.replace(hour=item.till.hour, minute=item.till.minute)
-                vevent_copy["dtend"] = icalendar.vDatetime(_dtend)
+                vevent_copy["dtend"] = get_local_vdatetime(_dtend)
 
             yield vevent_copy
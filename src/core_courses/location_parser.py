@@ -248,88 +248,171 @@ Item.model_rebuild()
 ydate = partial(date, year=datetime.today().year)
 
 
+def combine_patterns(patterns: list[str]) -> str:
+    return r"(" + "|".join(patterns) + r")"
+
+
+# ---- Patterns do not depend on the parsed string, so they are built and compiled once ----
+
+AND_PATTERN = re.compile(r"\s+AND\s+")
+AND_RU_PATTERN = re.compile(r"\s+И\s+")
+
+ROOM_NUMBER_PATTERN = re.compile(r"^(\d+)$")
+UNKNOWN_ROOM_PATTERN = re.compile(r"^\?$")
+ROOM_WITH_PREFIX_PATTERN = re.compile(r"^ROOM\s*#?\s*(\d+)$")
+ONLINE_PATTERN = re.compile(r"^(ONLINE|ОНЛАЙН)$")
+ONLINE_TBA_PATTERN = re.compile(r"^(ONLINE|ОНЛАЙН)\s*\(TBA\)$")
+ROOMS_SEPARATED_BY_SLASH_PATTERN = re.compile(r"^((\d|ONLINE|ОНЛАЙН)+(?:\s*/\s*(\d|ONLINE|ОНЛАЙН)+)+)$")
+
+_loc = combine_patterns(
+    [
+        r"(\d+)",
+        r"\?",
+        r"ROOM\s*#?\s*(\d+)",
+        r"(ONLINE|ОНЛАЙН)",
+        r"(ONLINE|ОНЛАЙН)\s*\(TBA\)",
+        r"((\d|ONLINE|ОНЛАЙН)+(?:\s*/\s*(\d|ONLINE|ОНЛАЙН)+)+)",
+    ]
+)
+
+
+def location_plus_pattern(group_name: str, pattern: str) -> str:
+    return rf"(?P<location>{_loc}) \(?(?P<{group_name}>{pattern})\)?"
+
+
+_starts_from_pattern = r"\(?(STARTS ON|STARTS FROM|FROM|С|НАЧАЛО С|СТАРТ|СТАРТ С)\s*(\d{1,2}[\/.]\d{1,2})\)?"
+_ends_on_pattern = r"\(?(ENDS ON|ДО|КОНЕЦ)\s*(\d{1,2}[\/.]\d{1,2})\)?"
+_starts_at_pattern = r"\(?(STARTS|STARTS AT|НАЧАЛО В|НАЧАЛО)\s*(\d{1,2}[:.]\d{1,2})\)?"
+_week_pattern = r"\(?WEEK\s*(?P<weeks>\d+(?:-\d+)?(?:,\s*\d+(?:-\d+)?)*)(?:\s+ONLY)?\)?"
+# ON 13/09, 20/09
+# ONLY ON 13/09 20/09
+# ТОЛЬКО НА 13/09, 20/09
+# and etc.
+_date_component_pattern = r"(?P<day>\d{1,2})[\/.](?P<month>\d{1,2})"
+_date_component_non_capturing = r"\d{1,2}[\/.]\d{1,2}"
+_on_pattern = rf"\(?(ON|ONLY ON|НА|ТОЛЬКО НА|ТОЛЬКО)\s*(?P<dates>{_date_component_non_capturing}(?:[,\s]\s*{_date_component_non_capturing})*)\)?"
+_till_pattern = r"\(?TILL\s*(?P<time>\d{1,2}[:.]\d{1,2})\)?"
+# EXCEPT 30/01 06/02
+# КРОМЕ 30/01, 06/02
+# и т.д.
+_except_pattern = rf"\(?(EXCEPT|КРОМЕ)\s*(?P<dates_except>{_date_component_non_capturing}(?:[,\s]+{_date_component_non_capturing})*)\)?"
+_mod = combine_patterns(
+    [
+        _starts_from_pattern,
+        _ends_on_pattern,
+        _starts_at_pattern,
+        _week_pattern,
+        _on_pattern,
+        _till_pattern,
+        _except_pattern,
+    ]
+)
+# replace all named groups with non-capturing groups
+_mod_noname = re.sub(r"\(\?P<[^>]+>", "(?:", _mod)
+_two_modifiers_pattern = rf"\(?(?P<first>{_mod_noname})\)?\s*\(?(?P<second>{_mod_noname})\)?"
+_three_modifiers_pattern = (
+    rf"\(?(?P<first>{_mod_noname})\)?\s*\(?(?P<second>{_mod_noname})\)?\s*\(?(?P<third>{_mod_noname})\)?"
+)
+# 316 (EXCEPT 16/04 108 ON 26/04)
+__modifier_with_nested = rf"(?P<location>{_loc})\s*\(\s*(?P<modifier>{_mod_noname})\s+(?P<another>.+?)\s*\)"
+_simple_nest_pattern = rf"(?P<location>{_loc})\s*\(?(?P<rest>.+)\)?"
+# 313 (WEEK 1-3) / ONLINE
+__1 = rf"(?P<location>{_loc})\s*\(?(?P<modifier>{_mod_noname})\)?\s*/\s*(?P<another>.+)"
+# 105 ON 15/10, 106 ON 29/10, ONLINE ON 05/11
+__4_3 = rf"(?P<l1>{_loc})\s*(?P<m1>{_mod_noname})\s*,\s*(?P<l2>{_loc})\s*(?P<m2>{_mod_noname})\s*,\s*(?P<l3>{_loc})\s*(?P<m3>{_mod})"
+# 105 ON 15/10, 106 ON 29/10
+__4_2 = rf"(?P<l1>{_loc})\s*(?P<m1>{_mod_noname})\s*,\s*(?P<l2>{_loc})\s*(?P<m2>{_mod_noname})"
+# ONLINE ON 13/09, 108 ON 01/11 (STARTS AT 9:00)
+__2 = rf"(?P<location>{_loc})\s*\(?(?P<modifier>{_mod_noname})\)?\s*,\s*(?P<another>.+?)\s*\(?(?P<common_modifier>{_mod_noname})\)?"
+# 314 (312 ON 12/09,19/09,26/09) 301 ON 03/10
+__3 = rf"(?P<location>{_loc})\s*\(?(?P<location2>{_loc})\s*(?P<modifier>{_mod_noname})\)?\s*(?P<another>.+)"
+# 107 (106 НА 16.09, 105 НА 07.10) = loc (loc1 mod1, loc2 mod2)
+__5 = rf"(?P<loc>{_loc})\s*\((?P<loc1>{_loc})\s*(?P<mod1>{_mod_noname}),\s*(?P<loc2>{_loc})\s*(?P<mod2>{_mod_noname})\)"
+# 317 ON 15/02, 22/02, 15/03, 22/03, 5/04, 12/04, 19/04 (ONLINE ON 26/04)
+__6 = rf"(?P<location>{_loc})\s*(?P<modifier>{_mod_noname})\s*\((?P<location2>{_loc})\s*(?P<mod2>{_mod_noname})\)"
+
+STARTS_FROM_PATTERN = re.compile(_starts_from_pattern)
+ENDS_ON_PATTERN = re.compile(_ends_on_pattern)
+STARTS_AT_PATTERN = re.compile(_starts_at_pattern)
+WEEK_PATTERN = re.compile(_week_pattern)
+DATE_COMPONENT_PATTERN = re.compile(_date_component_pattern)
+ON_PATTERN = re.compile(_on_pattern)
+TILL_PATTERN = re.compile(_till_pattern)
+EXCEPT_PATTERN = re.compile(_except_pattern)
+ANY_MODIFIER_PATTERN = re.compile(_mod)
+LOCATION_WITH_MODIFIER_PATTERN = re.compile(location_plus_pattern("any_modifier", _mod))
+TWO_MODIFIERS_PATTERN = re.compile(_two_modifiers_pattern)
+LOCATION_WITH_TWO_MODIFIERS_PATTERN = re.compile(location_plus_pattern("two_modifiers", _two_modifiers_pattern))
+THREE_MODIFIERS_PATTERN = re.compile(_three_modifiers_pattern)
+LOCATION_WITH_THREE_MODIFIERS_PATTERN = re.compile(location_plus_pattern("three_modifiers", _three_modifiers_pattern))
+MODIFIER_WITH_NESTED_PATTERN = re.compile(__modifier_with_nested)
+SIMPLE_NEST_PATTERN = re.compile(_simple_nest_pattern)
+LOCATION_MODIFIER_OR_ANOTHER_PATTERN = re.compile(__1)
+THREE_LOCATIONS_WITH_MODIFIERS_PATTERN = re.compile(__4_3)
+TWO_LOCATIONS_WITH_MODIFIERS_PATTERN = re.compile(__4_2)
+LOCATIONS_WITH_COMMON_MODIFIER_PATTERN = re.compile(__2)
+LOCATION_WITH_NESTED_LOCATION_PATTERN = re.compile(__3)
+LOCATION_WITH_TWO_NESTED_PATTERN = re.compile(__5)
+LOCATION_WITH_NESTED_MODIFIER_PATTERN = re.compile(__6)
+
+
 def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
     x = x.upper()
     x = x.replace("(ONLINE)", r"ONLINE")
     x = x.replace("(ОНЛАЙН)", r"ОНЛАЙН")
     x = x.strip()
     # replace AND with ,
-    x = re.sub(r"\s+AND\s+", ", ", x)
-    x = re.sub(r"\s+И\s+", ", ", x)
-
-    def combine_patterns(patterns):
-        return r"(" + "|".join(patterns) + r")"
+    x = AND_PATTERN.sub(", ", x)
+    x = AND_RU_PATTERN.sub(", ", x)
 
     def get_location(y: str):
-        if m := re.fullmatch(r"^(\d+)$", y):
+        if m := ROOM_NUMBER_PATTERN.fullmatch(y):
             return m.group(1)
 
-        if m := re.fullmatch(r"^\?$", y):
+        if m := UNKNOWN_ROOM_PATTERN.fullmatch(y):
             return "?"
 
-        if m := re.fullmatch(r"^ROOM\s*#?\s*(\d+)$", y):
+        if m := ROOM_WITH_PREFIX_PATTERN.fullmatch(y):
             return m.group(1)
 
-        if m := re.fullmatch(r"^(ONLINE|ОНЛАЙН)$", y):
+        if m := ONLINE_PATTERN.fullmatch(y):
             return m.group(0)
 
-        if m := re.fullmatch(r"^(ONLINE|ОНЛАЙН)\s*\(TBA\)$", y):
+        if m := ONLINE_TBA_PATTERN.fullmatch(y):
             return m.group(0)
 
-        if m := re.fullmatch(r"^((\d|ONLINE|ОНЛАЙН)+(?:\s*/\s*(\d|ONLINE|ОНЛАЙН)+)+)$", y):
+        if m := ROOMS_SEPARATED_BY_SLASH_PATTERN.fullmatch(y):
             locations = m.group(1)
             locations = locations.split("/")
             locations = [location.strip() for location in locations]
             return "/".join(locations)
 
-    _loc = combine_patterns(
-        [
-            r"(\d+)",
-            r"\?",
-            r"ROOM\s*#?\s*(\d+)",
-            r"(ONLINE|ОНЛАЙН)",
-            r"(ONLINE|ОНЛАЙН)\s*\(TBA\)",
-            r"((\d|ONLINE|ОНЛАЙН)+(?:\s*/\s*(\d|ONLINE|ОНЛАЙН)+)+)",
-        ]
-    )
-
-    def location_plus_pattern(group_name: str, pattern: str):
-        return rf"(?P<location>{_loc}) \(?(?P<{group_name}>{pattern})\)?"
-
     if as_simple_location := get_location(y=x):
         return Item(location=as_simple_location)
 
-    _starts_from_pattern = r"\(?(STARTS ON|STARTS FROM|FROM|С|НАЧАЛО С|СТАРТ|СТАРТ С)\s*(\d{1,2}[\/.]\d{1,2})\)?"
-
     def starts_from(y: str):
-        if m := re.fullmatch(_starts_from_pattern, y):
+        if m := STARTS_FROM_PATTERN.fullmatch(y):
             _date = m.group(2).replace(".", "/")
             day, month = _date.split(sep="/")
 
             return Item(starts_from=ydate(day=int(day), month=int(month)))
 
-    _ends_on_pattern = r"\(?(ENDS ON|ДО|КОНЕЦ)\s*(\d{1,2}[\/.]\d{1,2})\)?"
-
     def ends_on(y: str):
-        if m := re.fullmatch(_ends_on_pattern, y):
+        if m := ENDS_ON_PATTERN.fullmatch(y):
             _date = m.group(2).replace(".", "/")
             day, month = _date.split(sep="/")
 
             return Item(ends_on=ydate(day=int(day), month=int(month)))
 
-    _starts_at_pattern = r"\(?(STARTS|STARTS AT|НАЧАЛО В|НАЧАЛО)\s*(\d{1,2}[:.]\d{1,2})\)?"
-
     def starts_at(y: str):
-        if m := re.fullmatch(_starts_at_pattern, y):
+        if m := STARTS_AT_PATTERN.fullmatch(y):
             _time = m.group(2).replace(".", ":")
             hour, minute = _time.split(sep=":")
 
             return Item(starts_at=time(hour=int(hour), minute=int(minute)))
 
-    _week_pattern = r"\(?WEEK\s*(?P<weeks>\d+(?:-\d+)?(?:,\s*\d+(?:-\d+)?)*)(?:\s+ONLY)?\)?"
-
     def week(y: str):
-        if m := re.fullmatch(_week_pattern, y):
+        if m := WEEK_PATTERN.fullmatch(y):
             weeks = m.group("weeks")
             weeks = weeks.split(",")
             weeks = [w.split("-") for w in weeks]
@@ -337,51 +420,32 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
             weeks = [item for sublist in weeks for item in sublist]
             return Item(on_weeks=weeks)
 
-    # ON 13/09, 20/09
-    # ONLY ON 13/09 20/09
-    # ТОЛЬКО НА 13/09, 20/09
-    # and etc.
-    _date_component_pattern = r"(?P<day>\d{1,2})[\/.](?P<month>\d{1,2})"
-    _date_component_non_capturing = r"\d{1,2}[\/.]\d{1,2}"
-    _on_pattern = rf"\(?(ON|ONLY ON|НА|ТОЛЬКО НА|ТОЛЬКО)\s*(?P<dates>{_date_component_non_capturing}(?:[,\s]\s*{_date_component_non_capturing})*)\)?"
-
     def on(y: str):
-        if m := re.fullmatch(_on_pattern, y):
+        if m := ON_PATTERN.fullmatch(y):
             dates_str = m.group("dates")
             dates = [
                 ydate(day=int(dm.group("day")), month=int(dm.group("month")))
-                for dm in re.finditer(_date_component_pattern, dates_str)
+                for dm in DATE_COMPONENT_PATTERN.finditer(dates_str)
             ]
             return Item(on=dates)
 
-    _till_pattern = r"\(?TILL\s*(?P<time>\d{1,2}[:.]\d{1,2})\)?"
-
     def till(y: str):
-        if m := re.fullmatch(_till_pattern, y):
+        if m := TILL_PATTERN.fullmatch(y):
             _time = m.group("time").replace(".", ":")
             hour, minute = _time.split(sep=":")
             return Item(till=time(hour=int(hour), minute=int(minute)))
 
-    # EXCEPT 30/01 06/02
-    # КРОМЕ 30/01, 06/02
-    # и т.д.
-    _except_pattern = rf"\(?(EXCEPT|КРОМЕ)\s*(?P<dates_except>{_date_component_non_capturing}(?:[,\s]+{_date_component_non_capturing})*)\)?"
-
     def except_(y: str):
-        if m := re.fullmatch(_except_pattern, y):
+        if m := EXCEPT_PATTERN.fullmatch(y):
             dates_str = m.group("dates_except")
             dates = [
                 ydate(day=int(dm.group("day")), month=int(dm.group("month")))
-                for dm in re.finditer(_date_component_pattern, dates_str)
+                for dm in DATE_COMPONENT_PATTERN.finditer(dates_str)
             ]
             return Item(except_=dates)
 
-    _mod = combine_patterns(
-        [_starts_from_pattern, _ends_on_pattern, _starts_at_pattern, _week_pattern, _on_pattern, _till_pattern, _except_pattern]
-    )
-
     def any_modifier(y: str):
-        if m := re.fullmatch(_mod, y):
+        if m := ANY_MODIFIER_PATTERN.fullmatch(y):
             z = m.group(0)
             if as_starts_from := starts_from(z):
                 return as_starts_from
@@ -401,18 +465,14 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
     if as_any_modifier := any_modifier(x):
         return as_any_modifier
 
-    if m := re.fullmatch(location_plus_pattern("any_modifier", _mod), x):
+    if m := LOCATION_WITH_MODIFIER_PATTERN.fullmatch(x):
         location = get_location(m.group("location"))
         as_any_modifier = any_modifier(m.group("any_modifier"))
         as_any_modifier.location = location
         return as_any_modifier
 
-    # replace all named groups with non-capturing groups
-    _mod_noname = re.sub(r"\(\?P<[^>]+>", "(?:", _mod)
-    _two_modifiers_pattern = rf"\(?(?P<first>{_mod_noname})\)?\s*\(?(?P<second>{_mod_noname})\)?"
-
     def two_modifiers(y: str):
-        if m := re.fullmatch(_two_modifiers_pattern, y):
+        if m := TWO_MODIFIERS_PATTERN.fullmatch(y):
             z1, z2 = m.group("first"), m.group("second")
             as_z1 = any_modifier(z1)
             as_z2 = any_modifier(z2)
@@ -423,17 +483,14 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
     if as_two_modifiers := two_modifiers(x):
         return as_two_modifiers
 
-    if m := re.fullmatch(location_plus_pattern("two_modifiers", _two_modifiers_pattern), x):
+    if m := LOCATION_WITH_TWO_MODIFIERS_PATTERN.fullmatch(x):
         location = get_location(m.group("location"))
         as_two_modifiers = two_modifiers(m.group("two_modifiers"))
         as_two_modifiers.location = location
         return as_two_modifiers
-    _three_modifiers_pattern = (
-        rf"\(?(?P<first>{_mod_noname})\)?\s*\(?(?P<second>{_mod_noname})\)?\s*\(?(?P<third>{_mod_noname})\)?"
-    )
 
     def three_modifiers(y: str):
-        if m := re.fullmatch(_three_modifiers_pattern, y):
+        if m := THREE_MODIFIERS_PATTERN.fullmatch(y):
             z1, z2, z3 = m.group("first"), m.group("second"), m.group("third")
             as_z1 = any_modifier(z1)
             as_z2 = any_modifier(z2)
@@ -449,7 +506,7 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
     if as_three_modifiers := three_modifiers(x):
         return as_three_modifiers
 
-    if m := re.fullmatch(location_plus_pattern("three_modifiers", _three_modifiers_pattern), x):
+    if m := LOCATION_WITH_THREE_MODIFIERS_PATTERN.fullmatch(x):
         location = get_location(m.group("location"))
         as_three_modifiers = three_modifiers(m.group("three_modifiers"))
         as_three_modifiers.location = location
@@ -459,10 +516,8 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
         return None
 
     # 316 (EXCEPT 16/04 108 ON 26/04)
-    __modifier_with_nested = rf"(?P<location>{_loc})\s*\(\s*(?P<modifier>{_mod_noname})\s+(?P<another>.+?)\s*\)"
-
     def modifier_with_nested(y: str):
-        if m := re.fullmatch(__modifier_with_nested, y):
+        if m := MODIFIER_WITH_NESTED_PATTERN.fullmatch(y):
             location = get_location(m.group("location"))
             modifier = any_modifier(m.group("modifier"))
             another = parse_location_string(m.group("another"), from_parent=True)
@@ -474,10 +529,8 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
     if as_modifier_with_nested := modifier_with_nested(x):
         return as_modifier_with_nested
 
-    _simple_nest_pattern = rf"(?P<location>{_loc})\s*\(?(?P<rest>.+)\)?"
-
     def simple_nest(y: str):
-        if m := re.fullmatch(_simple_nest_pattern, y):
+        if m := SIMPLE_NEST_PATTERN.fullmatch(y):
             location = get_location(m.group("location"))
             rest = parse_location_string(m.group("rest"), from_parent=True)
             if rest is not None:
@@ -487,10 +540,8 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
         return as_simple_nest
 
     # 313 (WEEK 1-3) / ONLINE
-    __1 = rf"(?P<location>{_loc})\s*\(?(?P<modifier>{_mod_noname})\)?\s*/\s*(?P<another>.+)"
-
     def _1(y: str):
-        if m := re.fullmatch(__1, y):
+        if m := LOCATION_MODIFIER_OR_ANOTHER_PATTERN.fullmatch(y):
             location = get_location(m.group("location"))
             modifier = any_modifier(m.group("modifier"))
             another = parse_location_string(m.group("another"), from_parent=True)
@@ -502,13 +553,9 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
     if as__1 := _1(x):
         return as__1
 
-    # 105 ON 15/10, 106 ON 29/10, ONLINE ON 05/11
-    __4_3 = rf"(?P<l1>{_loc})\s*(?P<m1>{_mod_noname})\s*,\s*(?P<l2>{_loc})\s*(?P<m2>{_mod_noname})\s*,\s*(?P<l3>{_loc})\s*(?P<m3>{_mod})"
-    # 105 ON 15/10, 106 ON 29/10
-    __4_2 = rf"(?P<l1>{_loc})\s*(?P<m1>{_mod_noname})\s*,\s*(?P<l2>{_loc})\s*(?P<m2>{_mod_noname})"
-
+    # 105 ON 15/10, 106 ON 29/10 or 105 ON 15/10, 106 ON 29/10, ONLINE ON 05/11
     def _4(y: str):
-        if m := re.fullmatch(__4_2, y):
+        if m := TWO_LOCATIONS_WITH_MODIFIERS_PATTERN.fullmatch(y):
             l1 = get_location(m.group("l1"))
             m1 = any_modifier(m.group("m1"))
             l2 = get_location(m.group("l2"))
@@ -518,7 +565,7 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
                 m2.location = l2
                 m1.NEST = [m2]
                 return m1
-        if m := re.fullmatch(__4_3, y):
+        if m := THREE_LOCATIONS_WITH_MODIFIERS_PATTERN.fullmatch(y):
             l1 = get_location(m.group("l1"))
             m1 = any_modifier(m.group("m1"))
             l2 = get_location(m.group("l2"))
@@ -536,10 +583,8 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
         return as__4
 
     # ONLINE ON 13/09, 108 ON 01/11 (STARTS AT 9:00)
-    __2 = rf"(?P<location>{_loc})\s*\(?(?P<modifier>{_mod_noname})\)?\s*,\s*(?P<another>.+?)\s*\(?(?P<common_modifier>{_mod_noname})\)?"
-
     def _2(y: str):
-        if m := re.fullmatch(__2, y):
+        if m := LOCATIONS_WITH_COMMON_MODIFIER_PATTERN.fullmatch(y):
             location = get_location(m.group("location"))
             modifier = any_modifier(m.group("modifier"))
             another = parse_location_string(m.group("another"), from_parent=True)
@@ -559,10 +604,8 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
         return as__2
 
     # 314 (312 ON 12/09,19/09,26/09) 301 ON 03/10
-    __3 = rf"(?P<location>{_loc})\s*\(?(?P<location2>{_loc})\s*(?P<modifier>{_mod_noname})\)?\s*(?P<another>.+)"
-
     def _3(y: str):
-        if m := re.fullmatch(__3, y):
+        if m := LOCATION_WITH_NESTED_LOCATION_PATTERN.fullmatch(y):
             location = get_location(m.group("location"))
             location2 = get_location(m.group("location2"))
             modifier = any_modifier(m.group("modifier"))
@@ -576,10 +619,8 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
         return as__3
 
     # 107 (106 НА 16.09, 105 НА 07.10) = loc (loc1 mod1, loc2 mod2)
-    __5 = rf"(?P<loc>{_loc})\s*\((?P<loc1>{_loc})\s*(?P<mod1>{_mod_noname}),\s*(?P<loc2>{_loc})\s*(?P<mod2>{_mod_noname})\)"
-
     def _5(y: str):
-        if m := re.fullmatch(__5, y):
+        if m := LOCATION_WITH_TWO_NESTED_PATTERN.fullmatch(y):
             loc = get_location(m.group("loc"))
             loc1 = get_location(m.group("loc1"))
             mod1 = any_modifier(m.group("mod1"))
@@ -594,10 +635,8 @@ def parse_location_string(x: str, from_parent: bool = False) -> Item | None:
         return as__5
 
     # 317 ON 15/02, 22/02, 15/03, 22/03, 5/04, 12/04, 19/04 (ONLINE ON 26/04)
-    __6 = rf"(?P<location>{_loc})\s*(?P<modifier>{_mod_noname})\s*\((?P<location2>{_loc})\s*(?P<mod2>{_mod_noname})\)"
-
     def _6(y: str):
-        if m := re.fullmatch(__6, y):
+        if m := LOCATION_WITH_NESTED_MODIFIER_PATTERN.fullmatch(y):
             loc = get_location(m.group("location"))
             mod = any_modifier(m.group("modifier"))
             loc2 = get_location(m.group("location2"))
@@ -4,15 +4,12 @@ https://github.com/one-zero-eight/parsers/blob/main/src/core_courses/parser.py
 https://github.com/one-zero-eight/schedule-builder-backend/blob/main/src/core_courses/parser.py
 """
 
-import datetime
 import io
 import re
-from collections import defaultdict
 from collections.abc import Generator
 from itertools import pairwise
 
 import numpy as np
-import openpyxl
 import pandas as pd
 from openpyxl.utils import get_column_letter
 from pandas.core.frame import DataFrame
@@ -20,7 +17,10 @@ from pydantic import BaseModel, ConfigDict, Field
 
 from src.logging_ import logger
 
-from ..utils import WEEKDAYS, prettify_string, sanitize_sheet_name
+from ..utils import WEEKDAYS, WEEKDAYS_SET, WorkbookLoader, parse_time, prettify_string, sanitize_sheet_name
+
+TIMESLOT_PATTERN = re.compile(r"^\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}$")
+TIME_RANGE_PATTERN = re.compile(r"\d{1,2}:\d{2}-\d{1,2}:\d{2}")
 
 
 class CoreCourseCell(BaseModel):
@@ -45,6 +45,7 @@ class CoreCoursesParser:
 
     def __init__(self):
         self.last_dfs_merged_ranges: dict[str, list[tuple[int, int, int, int]]] | None = None
+        self.load_workbook = WorkbookLoader()
 
     def pipeline(
         self,
@@ -114,8 +115,6 @@ class CoreCoursesParser:
 
             time_columns_index = self.get_time_columns(sheet_df)
             logger.info(f"Sheet Time columns: {[get_column_letter(col + 1) for col in time_columns_index]}")
-            rightmost_column_index = self.get_rightmost_column_index(xlsx_file, target_sheet_name, time_columns_index)
-            logger.info(f"Rightmost column index: {get_column_letter(rightmost_column_index + 1)}")
 
             by_courses = self.split_df_by_courses(sheet_df, time_columns_index)
             grouped_dfs_with_cells_lst = []
@@ -125,10 +124,8 @@ class CoreCoursesParser:
                 self.set_weekday_and_time_as_index(course_df)
                 # ---- Convert it to GroupBy with CoreCourseCell(value=[subject, teacher, location], a1=excel_range) ----
                 grouped_dfs_with_cells = (
-                    course_df
                     # ---- Group by weekday and time ----
-                    .groupby(level=[0, 1], sort=False)
-                    .agg(list)
+                    self.group_by_weekday_and_time(course_df)
                     # ---- Convert each cell to CoreCourseCell ----
                     .map(
                         self.factory_core_course_cell,
@@ -159,7 +156,7 @@ class CoreCoursesParser:
             xlsx_file, engine="openpyxl", sheet_name=None, header=None, dtype=object
         )
         # ---- Clean up dataframes ----
-        merged_ranges: dict[str, list[tuple[int, int, int, int]]] = defaultdict(list)
+        merged_ranges: dict[str, list[tuple[int, int, int, int]]] = {}
         for target_sheet_name in target_sheet_names:
             df = dfs[target_sheet_name]
             # ---- Select range ----
@@ -169,10 +166,10 @@ class CoreCoursesParser:
             merged_ranges[target_sheet_name] = self.merge_cells(df, xlsx_file, target_sheet_name)
             # ---- Add excel range to each 'subject' cell (first of three cells) ----
             self.assign_excel_row_and_column_to_subject(df)
-            # ---- Fill empty cells ----
-            df = df.replace(r"^\s*$", np.nan, regex=True)
             # ---- Strip, translate and remove trailing spaces ----
             df = df.map(prettify_string)
+            # ---- Fill empty cells (values are stripped, so blank is just "") ----
+            df = df.mask(df.eq(""))
             # pandas 3: DataFrame.map on strings infers StringDtype; parser stores time tuples in cells
             df = df.astype(object)
             # ---- Update dataframe ----
@@ -199,16 +196,20 @@ class CoreCoursesParser:
     def get_time_columns(self, sheet_df: pd.DataFrame) -> list[int]:
         # find columns where presents "MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY"
         time_columns = []
-        for column in sheet_df.columns:
+        required_weekdays = frozenset(WEEKDAYS[:-1])
+        # one vectorized lookup over the whole sheet to skip columns without any weekday
+        has_weekday = sheet_df.isin(required_weekdays).to_numpy().any(axis=0)
+        for column in sheet_df.columns[has_weekday]:
             values_in_column = sheet_df[column].values
-            if all(weekday in values_in_column for weekday in WEEKDAYS[:-1]):
+            # one pass over column instead of scanning it for every weekday
+            if required_weekdays.issubset(values_in_column):
                 time_columns.append(column)
         return time_columns
 
     def get_rightmost_column_index(self, xlsx_file: io.BytesIO, sheet_name: str, time_columns: list[int]) -> int:
         # Column after time columns that has no borders formatting
 
-        wb = openpyxl.load_workbook(xlsx_file)
+        wb = self.load_workbook(xlsx_file)
         sheet = wb[sheet_name]
         last_time_column = time_columns[-1]
 
@@ -237,32 +238,34 @@ class CoreCoursesParser:
             return next_column  # fallback
 
     def get_last_row_index(self, xlsx_file: io.BytesIO, sheet_name: str) -> int:
-        wb = openpyxl.load_workbook(xlsx_file)
+        wb = self.load_workbook(xlsx_file)
         sheet = wb[sheet_name]
         return sheet.max_row
 
     def assign_excel_row_and_column_to_subject(self, df: pd.DataFrame) -> None:
         def check_value_is_time(string_to_check: str) -> bool:
-            return bool(re.match(r"^\d{1,2}:\d{2}\s*-\s*\d{1,2}:\d{2}$", string_to_check))
+            return ":" in string_to_check and TIMESLOT_PATTERN.match(string_to_check) is not None
 
         used_cells: set[tuple[int, int]] = set()
-        for i in range(3, len(df.values)):
-            for j in range(1, len(df.values[i])):
+        # read cells from a snapshot, only subject cells are written back to df
+        values = df.to_numpy()
+        for i in range(3, values.shape[0]):
+            for j in range(1, values.shape[1]):
                 if (i, j) in used_cells:
                     continue
 
-                v = df.iloc[i, j]
+                v = values[i, j]
                 if isinstance(v, str):
                     v = v.strip()
 
                 if isinstance(v, int) or isinstance(v, float):
                     continue  # Quick fix, assuming that class name cannot be number
 
-                if not v or pd.isna(v) or v in WEEKDAYS or check_value_is_time(v):
+                if not v or pd.isna(v) or v in WEEKDAYS_SET or check_value_is_time(v):
                     continue
 
                 excel_coords = f"{get_column_letter(j + 1)}{i + 1}"
-                df.iloc[i, j] = f"{df.iloc[i, j]}${excel_coords}"
+                df.iat[i, j] = f"{values[i, j]}${excel_coords}"
                 for x in range(i, i + 3):
                     used_cells.add((x, j))
 
@@ -277,12 +280,13 @@ class CoreCoursesParser:
         :param target_sheet_name: sheet to process
         :return: list of merged ranges: (min_row, min_col, max_row, max_col)
         """
-        xlsx.seek(0)
-        ws = openpyxl.load_workbook(xlsx)
+        ws = self.load_workbook(xlsx)
         sheet = ws[target_sheet_name]
 
         merged_ranges = []
         nrows, ncols = df.shape
+        # fill merged ranges on a numpy copy and write it back once, iloc assignment per range is costly
+        values = df.to_numpy(copy=True)
 
         def clamp_rows(n: int) -> int:
             return max(min(n, nrows - 1), 0)
@@ -297,10 +301,11 @@ class CoreCoursesParser:
             max_col = clamp_cols(max_col - 1)
             max_row = clamp_rows(max_row - 1)
 
-            value = df.iloc[min_row, min_col]
-            df.iloc[min_row : max_row + 1, min_col : max_col + 1] = value
+            values[min_row : max_row + 1, min_col : max_col + 1] = values[min_row, min_col]
             merged_ranges.append((min_row, min_col, max_row, max_col))
 
+        if merged_ranges:
+            df.iloc[:, :] = values
         return merged_ranges
 
     def set_weekday_and_time_as_index(self, df: pd.DataFrame, column: int = 0) -> None:
@@ -322,26 +327,25 @@ class CoreCoursesParser:
         df_column.ffill(inplace=True)
 
         # ----- Process weekday ------ #
-        # get indexes of weekdays
-        weekdays_indexes = [i for i, cell in enumerate(df_column.values) if cell in WEEKDAYS]
+        # get mask of weekday rows
+        is_weekday = df_column.isin(WEEKDAYS)
 
-        # create index mapping for weekdays [None, None, "MONDAY", "MONDAY", ...]
-        index_mapping = pd.Series(index=df_column.index, dtype=object)
-        last_index = len(df_column)
-        for start, end in pairwise(weekdays_indexes + [last_index]):
-            index_mapping.iloc[start] = "delete"
-            index_mapping.iloc[start + 1 : end] = df_column[start]
+        # create index mapping for weekdays [None, "delete", "MONDAY", "MONDAY", ...] with a forward fill
+        index_mapping = df_column.where(is_weekday).ffill()
+        index_mapping[is_weekday] = "delete"
 
         # ----- Process time ------ #
-        matched = df_column[df_column.str.match(r"\d{1,2}:\d{2}-\d{1,2}:\d{2}")]
-
-        for i, cell in matched.items():
-            # "9:00-10:30" -> datetime.time(9, 0), datetime.time(10, 30)
-            start, end = cell.split("-")
-            df_column.loc[i] = (
-                datetime.datetime.strptime(start, "%H:%M").time(),
-                datetime.datetime.strptime(end, "%H:%M").time(),
-            )
+        # plain loop over the column values, .str accessor and .loc assignment per timeslot are costly
+        times = df_column.tolist()
+        for i, cell in enumerate(times):
+            if isinstance(cell, str) and TIME_RANGE_PATTERN.match(cell):
+                # "9:00-10:30" -> datetime.time(9, 0), datetime.time(10, 30)
+                start, end = cell.split("-")
+                times[i] = (
+                    parse_time(start),
+                    parse_time(end),
+                )
+        df_column = pd.Series(times, index=df_column.index, dtype=object)
 
         # create multiindex from index mapping and time column
         multiindex = pd.MultiIndex.from_arrays([index_mapping, df_column], names=["weekday", "time"])
@@ -373,6 +377,29 @@ class CoreCoursesParser:
         multiindex = pd.MultiIndex.from_arrays(df_header.values, names=["course", "group"])
         df.columns = multiindex
 
+    def group_by_weekday_and_time(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Collect cells of each (weekday, timeslot) into lists
+
+        :param df: dataframe with weekday and timeslot as index
+        :type df: pd.DataFrame
+        :return: dataframe with list of cells for each (weekday, timeslot)
+        :rtype: pd.DataFrame
+        """
+        index = df.index
+        codes = np.column_stack(index.codes)
+        if len(codes) and (codes != -1).all():
+            # rows of a timeslot are usually adjacent, so groups are runs of equal keys
+            starts = np.flatnonzero(np.r_[True, (codes[1:] != codes[:-1]).any(axis=1)])
+            if len(starts) == len(set(map(tuple, codes[starts].tolist()))):
+                # every key is a single run: slice the runs out of the array, skip the groupby machinery
+                values = df.to_numpy()
+                ends = np.r_[starts[1:], len(values)]
+                data = [[list(column) for column in values[start:end].T] for start, end in zip(starts, ends)]
+                # cells are lists, skip dtype inference over them
+                return pd.DataFrame(data, index=index[starts], columns=df.columns, dtype=object)
+        return df.groupby(level=[0, 1], sort=False).agg(list)
+
     def factory_core_course_cell(
         self,
         values: list[str | None],
@@ -3,26 +3,32 @@ import json
 import os
 from pathlib import Path
 
-from src.config_base import SaveConfig, from_yaml
+import icalendar
+
+from src.config_base import SaveConfig, load_yaml
 from src.electives.config import ElectivesParserConfig
 from src.electives.event_to_ical import generate_vevent
 from src.electives.parser import ElectiveParser
 from src.innohassle import CreateEventGroup, CreateTag, InNoHassleEventsClient, Output, update_inh_event_groups
 from src.logging_ import logger
-from src.utils import fetch_xlsx_spreadsheet, get_base_calendar, get_sheet_gids, sluggify
+from src.utils import fetch_xlsx_spreadsheet, get_base_calendar, get_sheet_gids, sluggify, write_calendars
 
 
 async def main():
     config_path = Path(__file__).parent / "config.yaml"
-    parser_config = from_yaml(ElectivesParserConfig, config_path)
-    save_config = from_yaml(SaveConfig, config_path)
+    yaml_config = load_yaml(config_path)
+    parser_config = ElectivesParserConfig.model_validate(yaml_config)
+    save_config = SaveConfig.model_validate(yaml_config)
     if not parser_config.spreadsheet_id:
         logger.error("Spreadsheet ID is not set")
         return None
 
     parser = ElectiveParser()
-    xlsx = await fetch_xlsx_spreadsheet(spreadsheet_id=parser_config.spreadsheet_id)
-    sheet_gids = await get_sheet_gids(parser_config.spreadsheet_id)
+    # xlsx export and sheet gids are independent requests, fetch them together
+    xlsx, sheet_gids = await asyncio.gather(
+        fetch_xlsx_spreadsheet(spreadsheet_id=parser_config.spreadsheet_id),
+        get_sheet_gids(parser_config.spreadsheet_id),
+    )
     logger.debug(f"Found sheet gids: {sheet_gids}")
 
     original_target_sheet_names = [target.sheet_name for target in parser_config.targets]
@@ -49,6 +55,7 @@ async def main():
     predefined_event_groups: list[CreateEventGroup] = []
     mount_point = save_config.save_ics_path
 
+    calendars_to_write: list[tuple[Path, icalendar.Calendar]] = []
     for target, separations in zip(parser_config.targets, pipeline_result):
         elective_type_directory = mount_point / sluggify(target.sheet_name)
         elective_type_directory.mkdir(parents=True, exist_ok=True)
@@ -81,10 +88,7 @@ async def main():
             logger.info(f"> Writing {file_path}")
 
             os.makedirs(file_path.parent, exist_ok=True)
-            with open(file_path, "wb") as f:
-                content = calendar.to_ical()
-                # TODO: add validation
-                f.write(content)
+            calendars_to_write.append((file_path, calendar))
 
             description = f"Elective schedule for '{elective.name or elective.alias}'"
             predefined_event_groups.append(
@@ -101,11 +105,13 @@ async def main():
                 )
             )
 
+    write_calendars(calendars_to_write)
+
     logger.info(f"Writing JSON file... {len(predefined_event_groups)} event groups.")
     output = Output(event_groups=predefined_event_groups, tags=tags)
     # create a new .json file with information about calendar
     with open(save_config.save_json_path, "w") as f:
-        json.dump(output.model_dump(), f, indent=2, sort_keys=False)
+        f.write(json.dumps(output.model_dump(), indent=2, sort_keys=False))
     # InNoHassle integration
     if save_config.innohassle_api_url is None or save_config.parser_auth_key is None:
         logger.info("Skipping InNoHassle integration")
@@ -1,12 +1,19 @@
 import datetime
 import re
+import sys
 from collections.abc import Generator
 
 from pydantic import BaseModel
 
-from ..utils import MOSCOW_TZ
+from ..utils import MOSCOW_TZ, parse_time
 from .config import Elective
 
+TIMESLOT_PATTERN = re.compile(r"\(?(\d{2}:\d{2})-(\d{2}:\d{2})\)?")
+STARTS_AT_PATTERN = re.compile(r"\(?(?:starts at|начало в)\s+(\d{2}:\d{2})\)?", flags=re.IGNORECASE)
+ENDS_AT_PATTERN = re.compile(r"\(?(?:ends at|конец в)\s+(\d{2}:\d{2})\)?", flags=re.IGNORECASE)
+CLASS_TYPE_PATTERN = re.compile(r"\(?(lab|lec|лек|сем)\)?", flags=re.IGNORECASE)
+GROUP_PATTERN = re.compile(r"\(?(G\d+)\)?")
+
 
 class ElectiveEvent(BaseModel):
     elective: Elective
@@ -41,10 +48,12 @@ def convert_cell_to_events(
     cell: ElectiveCell,
     date: datetime.date,
     timeslot: tuple[datetime.time, datetime.time],
-    electives: list[Elective],
+    electives: dict[str, Elective],
 ) -> Generator[ElectiveEvent]:
     """
     Parse cell value
+
+    :param electives: electives by short name
     """
     overall_start, overall_end = timeslot
     overall_start = datetime.datetime.combine(date, overall_start, tzinfo=MOSCOW_TZ)
@@ -69,7 +78,7 @@ def parse_one_line_in_value(
     date: datetime.date,
     overall_start: datetime.datetime,
     overall_end: datetime.datetime,
-    electives: list[Elective],
+    electives: dict[str, Elective],
     *,
     spreadsheet_id: str,
     google_sheet_gid: str,
@@ -95,39 +104,39 @@ def parse_one_line_in_value(
 
     string = value.strip()
 
-    # just first word as elective
-    splitter = string.split(" ")
-    elective_short_name = splitter[0]
-    elective = next((elective for elective in electives if elective.short_name == elective_short_name), None)
-    string = " ".join(splitter[1:])
+    # just first word as elective, the rest is left as is
+    elective_short_name, _, string = string.partition(" ")
+    elective = electives.get(elective_short_name)
 
-    # find time xx:xx-xx:xx
     starts_at = ends_at = None
-    if timeslot_m := re.search(r"\(?(\d{2}:\d{2})-(\d{2}:\d{2})\)?", string):
-        starts_at = datetime.datetime.strptime(timeslot_m.group(1), "%H:%M").time()
-        ends_at = datetime.datetime.strptime(timeslot_m.group(2), "%H:%M").time()
-        string = string.replace(timeslot_m.group(0), "")
-
-    # find starts at xx:xx (Case insensitive, handles English and Russian)
-    if timeslot_m := re.search(r"\(?(?:starts at|начало в)\s+(\d{2}:\d{2})\)?", string, flags=re.IGNORECASE):
-        starts_at = datetime.datetime.strptime(timeslot_m.group(1), "%H:%M").time()
-        string = string.replace(timeslot_m.group(0), "")
-
-    # find ends at xx:xx (Case insensitive, handles English and Russian)
-    if timeslot_m := re.search(r"\(?(?:ends at|конец в)\s+(\d{2}:\d{2})\)?", string, flags=re.IGNORECASE):
-        ends_at = datetime.datetime.strptime(timeslot_m.group(1), "%H:%M").time()
-        string = string.replace(timeslot_m.group(0), "")
+    # all time patterns contain a colon, skip the regex scans for lines without times
+    if ":" in string:
+        # find time xx:xx-xx:xx
+        if timeslot_m := TIMESLOT_PATTERN.search(string):
+            starts_at = parse_time(timeslot_m.group(1))
+            ends_at = parse_time(timeslot_m.group(2))
+            string = string.replace(timeslot_m.group(0), "")
+
+        # find starts at xx:xx (Case insensitive, handles English and Russian)
+        if timeslot_m := STARTS_AT_PATTERN.search(string):
+            starts_at = parse_time(timeslot_m.group(1))
+            string = string.replace(timeslot_m.group(0), "")
+
+        # find ends at xx:xx (Case insensitive, handles English and Russian)
+        if timeslot_m := ENDS_AT_PATTERN.search(string):
+            ends_at = parse_time(timeslot_m.group(1))
+            string = string.replace(timeslot_m.group(0), "")
 
     # find (lab), (lec)
-    if class_type_m := re.search(r"\(?(lab|lec|лек|сем)\)?", string, flags=re.IGNORECASE):
-        class_type = class_type_m.group(1).lower()
+    if class_type_m := CLASS_TYPE_PATTERN.search(string):
+        class_type = sys.intern(class_type_m.group(1).lower())
         string = string.replace(class_type_m.group(0), "")
     else:
         class_type = None
 
     # find (G1)
-    if group_m := re.search(r"\(?(G\d+)\)?", string):
-        group = group_m.group(1)
+    if group_m := GROUP_PATTERN.search(string):
+        group = sys.intern(group_m.group(1))
         string = string.replace(group_m.group(0), "")
     else:
         group = None
@@ -135,7 +144,8 @@ def parse_one_line_in_value(
     # find location (what is left)
     string = string.strip()
     if string:
-        location = string
+        # same few rooms repeat over the whole sheet, share one string object
+        location = sys.intern(string)
     else:
         location = None
 
@@ -1,3 +1,5 @@
+import datetime
+import functools
 from zlib import crc32
 
 import icalendar
@@ -36,6 +38,39 @@ def get_uid(event: ElectiveEvent) -> str:
     return f"{abs(get_event_hash(event)):x}@innohassle.ru"
 
 
+@functools.cache
+def get_time_range_string(start: datetime.time, end: datetime.time) -> str:
+    """
+    Format time range, cached as events share a few timeslots
+
+    :param start: start time
+    :param end: end time
+    :return: time range string, e.g. "09:00 - 10:30"
+    """
+    return f"{start.strftime('%H:%M')} - {end.strftime('%H:%M')}"
+
+
+@functools.cache
+def get_description_header(name: str | None, instructor: str | None, group: str | None) -> str:
+    """
+    Description lines shared by all events of an elective group, cached as they do not depend on the date
+
+    :param name: elective name
+    :param instructor: elective instructor
+    :param group: event group
+    :return: description lines, ending with a line break if not empty
+    """
+    r = (
+        # ("Location", event.location),
+        ("Subject", name),
+        ("Instructor", instructor),
+        # ("Type", event.class_type),
+        ("Group", group),
+    )
+
+    return "".join([f"{k}: {v}\n" for k, v in r if v])
+
+
 def get_description(event: ElectiveEvent) -> str:
     """
     Get description for the event
@@ -43,18 +78,11 @@ def get_description(event: ElectiveEvent) -> str:
     :param event: The elective event
     :return: Description string
     """
-    r = {
-        # "Location": event.location,
-        "Subject": event.elective.name,
-        "Instructor": event.elective.instructor,
-        # "Type": event.class_type,
-        "Group": event.group,
-        "Time": f"{event.start.strftime('%H:%M')} - {event.end.strftime('%H:%M')}",
-        "Date": event.start.strftime("%d.%m.%Y"),
-    }
-
-    r = {k: v for k, v in r.items() if v}
-    return "\n".join([f"{k}: {v}" for k, v in r.items()])
+    header = get_description_header(event.elective.name, event.elective.instructor, event.group)
+    time_range = get_time_range_string(event.start.time(), event.end.time())
+    start = event.start
+    # numeric fields formatted directly, strftime is noticeably slower for a fixed format
+    return f"{header}Time: {time_range}\nDate: {start.day:02d}.{start.month:02d}.{start.year}"
 
 
 def get_summary(event: ElectiveEvent) -> str:
@@ -79,6 +107,17 @@ def get_summary(event: ElectiveEvent) -> str:
         return elective_name
 
 
+@functools.cache
+def get_vdatetime(dt: datetime.datetime) -> icalendar.vDatetime:
+    """
+    Datetime property, shared by all events starting or ending at the same moment (e.g. parallel electives)
+
+    :param dt: aware datetime
+    :return: icalendar datetime property
+    """
+    return icalendar.vDatetime(dt)
+
+
 def generate_vevent(event: ElectiveEvent, spreadsheet_id: str) -> icalendar.Event:
     """
     Generate icalendar event from an ElectiveEvent
@@ -90,8 +129,8 @@ def generate_vevent(event: ElectiveEvent, spreadsheet_id: str) -> icalendar.Even
     vevent = icalendar.Event()
 
     vevent["summary"] = get_summary(event)
-    vevent["dtstart"] = icalendar.vDatetime(event.start)
-    vevent["dtend"] = icalendar.vDatetime(event.end)
+    vevent["dtstart"] = get_vdatetime(event.start)
+    vevent["dtend"] = get_vdatetime(event.end)
     vevent["uid"] = get_uid(event)
     if event.elective.name is not None:
         vevent["categories"] = event.elective.name
@@ -5,28 +5,57 @@ https://github.com/one-zero-eight/schedule-builder-backend/blob/main/src/parsers
 """
 
 import datetime
+import functools
 import io
 import re
 import warnings
 from collections.abc import Generator
-from itertools import groupby, pairwise
+from itertools import pairwise
 
-import numpy as np
-import openpyxl
 import pandas as pd
 from openpyxl.utils import get_column_letter
 from pydantic import BaseModel
 
 from src.logging_ import logger
 
-from ..utils import prettify_string, sanitize_sheet_name
+from ..utils import WEEKDAYS, WEEKDAYS_SET, WorkbookLoader, parse_time, prettify_string, sanitize_sheet_name
 from .cell_to_event import ElectiveEvent
 from .config import Elective
 
 BRACKETS_PATTERN = re.compile(r"\((.*?)\)")
+TIMESLOT_PATTERN = re.compile(r"\d{1,2}:\d{2}-\d{1,2}:\d{2}")
+DATE_PATTERN = re.compile(r"\w+ \d+")
+WEEK_PATTERN = re.compile(r"Week \d")
 IGNORED_CELL_VALUES = frozenset({"проект", "бжд", "а", "тсп", "физ"})
 
 
+@functools.cache
+def get_elective_line_pattern(elective_short_names: tuple[str, ...]) -> re.Pattern[str]:
+    """
+    Single alternation of all elective short names, every line is scanned once for all of them.
+    Compiled once per electives list and shared by all sheets. Names are escaped and the longest go first,
+    so a name that is a prefix of another one (IDO, IDORU) never cuts the longer match short
+
+    :param elective_short_names: short names of electives
+    :return: compiled pattern with `elective_short_name` group
+    """
+    alternatives = sorted(set(elective_short_names), key=len, reverse=True)
+    return re.compile(r"(?P<elective_short_name>" + "|".join(map(re.escape, alternatives)) + r")")
+
+
+@functools.cache
+def parse_month_day(string: str, year: int) -> datetime.date:
+    """
+    Parse date header like "June 7", cached as sheets of all elective types share the same dates.
+    Year is parsed together with the date, so "February 29" is valid in leap years
+
+    :param string: month name and day, e.g. "June 7"
+    :param year: year of the date
+    :return: parsed date
+    """
+    return datetime.datetime.strptime(f"{string} {year}", "%B %d %Y").date()
+
+
 class ElectiveCell(BaseModel):
     value: list[str]
     "Original cell value"
@@ -53,6 +82,9 @@ class ElectiveParser:
     Elective parser class
     """
 
+    def __init__(self):
+        self.load_workbook = WorkbookLoader()
+
     def pipeline(
         self,
         xlsx_file: io.BytesIO,
@@ -133,9 +165,10 @@ class ElectiveParser:
             # -------- Set time column as index --------
             df = self.set_time_column_as_index(df)
             # -------- Strip all values --------
-            df = df.map(lambda x: x.strip() if isinstance(x, str) else x)
-            # -------- Fill empty cells --------
-            df = df.replace(r"^\s*$", np.nan, regex=True)
+            values = [[x.strip() if isinstance(x, str) else x for x in row] for row in df.to_numpy().tolist()]
+            df = pd.DataFrame(values, index=df.index, columns=df.columns, dtype=object)
+            # -------- Fill empty cells (values are stripped, so blank is just "") --------
+            df = df.mask(df.eq(""))
             # -------- Exclude nan rows --------
             df = df.dropna(how="all")
             # -------- Strip, translate and remove trailing spaces --------
@@ -167,16 +200,16 @@ class ElectiveParser:
         #     cal: list[ElectiveEvent]
         #     cal.extend(_events)
 
-        # only by Elective
-        for elective, _events in groupby(events, lambda e: e.elective):
-            elective: Elective
-            if elective.alias not in output:
-                output[elective.alias] = Separation(
-                    elective=elective,
-                    events=list(_events),
+        # only by Elective, bucket by alias in one pass: events are not sorted and comparing Elective models is costly
+        for event in events:
+            separation = output.get(event.elective.alias)
+            if separation is None:
+                output[event.elective.alias] = Separation(
+                    elective=event.elective,
+                    events=[event],
                 )
             else:
-                output[elective.alias].events.extend(_events)
+                separation.events.append(event)
 
         return list(output.values())
 
@@ -187,14 +220,12 @@ class ElectiveParser:
         :return: tuple of (min_row, min_col, max_row, max_col)
         """
 
-        weekdays = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
-
         # find all columns named as weekday by checking the first row
         first_row = sheet_df.iloc[0]
         weekday_columns_index = [
-            i for i, value in enumerate(first_row) if isinstance(value, str) and value.upper().strip() in weekdays
+            i for i, value in enumerate(first_row) if isinstance(value, str) and value.upper().strip() in WEEKDAYS_SET
         ]
-        assert len(weekday_columns_index) == len(weekdays), "Weekday columns not found"
+        assert len(weekday_columns_index) == len(WEEKDAYS), "Weekday columns not found"
         rightmost_column_index = max(weekday_columns_index)
         leftmost_column_index = min(weekday_columns_index) - 1
         logger.info(f"Rightmost column index: {get_column_letter(rightmost_column_index + 1)}")
@@ -204,7 +235,7 @@ class ElectiveParser:
         return (0, leftmost_column_index, last_row_index, rightmost_column_index)
 
     def get_last_row_index(self, xlsx_file: io.BytesIO, sheet_name: str) -> int:
-        wb = openpyxl.load_workbook(xlsx_file)
+        wb = self.load_workbook(xlsx_file)
         sheet = wb[sheet_name]
         return sheet.max_row
 
@@ -223,11 +254,11 @@ class ElectiveParser:
             if "$" in cell:
                 cell, a1 = cell.rsplit("$", maxsplit=1)
                 cell = cell.strip()
-            if re.match(r"\d{1,2}:\d{2}-\d{1,2}:\d{2}", cell):
+            if TIMESLOT_PATTERN.match(cell):
                 start, end = cell.split("-")
                 return (
-                    datetime.datetime.strptime(start, "%H:%M").time(),
-                    datetime.datetime.strptime(end, "%H:%M").time(),
+                    parse_time(start),
+                    parse_time(end),
                 )
             else:
                 return cell
@@ -247,15 +278,15 @@ class ElectiveParser:
         :type row: int, optional
         """
 
+        current_year = datetime.date.today().year
+
         # "June 7" -> datetime.date(current_year, 6, 7)
         def process_date_cell(cell: str) -> datetime.date | str:
             if "$" in cell:
                 cell, a1 = cell.rsplit("$", maxsplit=1)
                 cell = cell.strip()
-            if re.match(r"\w+ \d+", cell):
-                dtime = datetime.datetime.strptime(cell, "%B %d")
-                dtime = dtime.replace(year=datetime.date.today().year)
-                return dtime.date()
+            if DATE_PATTERN.match(cell):
+                return parse_month_day(cell, current_year)
             else:
                 return cell
 
@@ -277,9 +308,10 @@ class ElectiveParser:
         :param min_col: minimum column index in original sheet (0-indexed)
         :type min_col: int
         """
-        for i in range(len(df.values)):
-            for j in range(len(df.values[i])):
-                v = df.iloc[i, j]
+        values = df.to_numpy()
+        for i in range(values.shape[0]):
+            for j in range(values.shape[1]):
+                v = values[i, j]
                 if pd.isna(v) or not isinstance(v, str) or not v.strip():
                     continue
 
@@ -290,7 +322,7 @@ class ElectiveParser:
 
                 # Add coordinates to cell value if not already present
                 if "$" not in v:
-                    df.iloc[i, j] = f"{v}${excel_coords}"
+                    df.iat[i, j] = f"{v}${excel_coords}"
 
     def split_df_by_weeks(self, df: pd.DataFrame) -> list[pd.DataFrame]:
         """
@@ -305,9 +337,10 @@ class ElectiveParser:
         logger.debug("Parsing dataframe to separation by days|groups...")
         logger.debug("Get 'week' indexes...")
         # find indexes of row with "Week *"
-        where = df.index.str.contains(r"Week \d", na=False)
-        week_indexes = df.index[where]
-        week_locations = df.index.get_indexer_for(week_indexes).tolist()
+        # index is short and mixes timeslot tuples with labels, plain loop is cheaper than .str accessor
+        week_locations = [
+            i for i, label in enumerate(df.index.tolist()) if isinstance(label, str) and WEEK_PATTERN.search(label)
+        ]
         logger.debug(f"> Found {len(week_locations)} weeks")
 
         max_x, _ = df.shape
@@ -349,13 +382,17 @@ class ElectiveParser:
         """
         from .cell_to_event import convert_cell_to_events
 
-        _elective_short_names = [e.short_name for e in electives]
+        _elective_short_names = tuple(e.short_name for e in electives)
+        # lookup by short name for every parsed line, first elective wins on duplicates as with linear search
+        electives_by_short_name: dict[str, Elective] = {}
+        for elective in electives:
+            electives_by_short_name.setdefault(elective.short_name, elective)
         has_electives = bool(_elective_short_names)
         
         # Compile pattern only if we have electives (will be checked before use)
         _elective_line_pattern: re.Pattern[str] | None = None
         if has_electives:
-            _elective_line_pattern = re.compile(r"(?P<elective_short_name>" + "|".join(_elective_short_names) + r")")
+            _elective_line_pattern = get_elective_line_pattern(_elective_short_names)
 
         def process_line(line: str) -> ElectiveCell | None:
             """
@@ -423,13 +460,15 @@ class ElectiveParser:
                 a1=a1,
             )
 
-        df = df.map(lambda x: process_line(x) if isinstance(x, str) else x)
-
-        for date, date_column in df.items():
+        # iterate over a numpy snapshot, pandas Series per date column are not needed;
+        # cells are processed right here, no intermediate DataFrame.map over the whole sheet
+        values = df.to_numpy()
+        timeslots = df.index.tolist()
+        for j, date in enumerate(df.columns):
             if not isinstance(date, datetime.date):
                 warnings.warn(f"Expected date as index, got {type(date).__name__}")
                 continue
-            for timeslot, cell in date_column.items():
+            for timeslot, value in zip(timeslots, values[:, j]):
                 if not (
                     isinstance(timeslot, tuple)
                     and len(timeslot) == 2
@@ -438,5 +477,6 @@ class ElectiveParser:
                     warnings.warn(f"Expected timeslot as tuple of two datetime.time, got {timeslot!r}")
                     continue
 
+                cell = process_line(value) if isinstance(value, str) else value
                 if isinstance(cell, ElectiveCell):
-                    yield from convert_cell_to_events(cell, date, timeslot, electives)
+                    yield from convert_cell_to_events(cell, date, timeslot, electives_by_short_name)
@@ -11,11 +11,13 @@ __all__ = [
 ]
 
 import asyncio
+import contextlib
 import datetime
 import json
 import pathlib
 import re
 import warnings
+from collections.abc import AsyncIterator
 from functools import partial
 from typing import Any
 
@@ -88,6 +90,7 @@ class InNoHassleEventsClient:
     def __init__(self, api_url: str, parser_auth_key: str):
         self.api_url = api_url
         self.parser_auth_key = parser_auth_key
+        self._shared_session: aiohttp.ClientSession | None = None
 
     def session(self) -> aiohttp.ClientSession:
         return aiohttp.ClientSession(
@@ -95,8 +98,28 @@ class InNoHassleEventsClient:
             json_serialize=partial(json.dumps, default=json_serial),
         )
 
-    async def get_event_groups(self) -> list[ViewEventGroup]:
+    @contextlib.asynccontextmanager
+    async def shared_session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """
+        Reuse one authorized session (and its connection pool) for all requests made inside the block
+        """
+        async with self.session() as s:
+            self._shared_session = s
+            try:
+                yield s
+            finally:
+                self._shared_session = None
+
+    @contextlib.asynccontextmanager
+    async def _session(self) -> AsyncIterator[aiohttp.ClientSession]:
+        if self._shared_session is not None:
+            yield self._shared_session
+            return
         async with self.session() as s:
+            yield s
+
+    async def get_event_groups(self) -> list[ViewEventGroup]:
+        async with self._session() as s:
             async with s.get(f"{self.api_url}/event-groups/") as response:
                 response.raise_for_status()
                 groups_dict = await response.json()
@@ -107,7 +130,7 @@ class InNoHassleEventsClient:
             return []
         data = {"event_groups": [group.dict() for group in event_groups]}
 
-        async with self.session() as s:
+        async with self._session() as s:
             async with s.post(f"{self.api_url}/event-groups/batch-create-or-read", json=data) as response:
                 response.raise_for_status()
                 groups_dict = await response.json()
@@ -117,7 +140,7 @@ class InNoHassleEventsClient:
         data = aiohttp.FormData()
         data.add_field("ics_file", ics_content, content_type="text/calendar")
 
-        async with self.session() as s:
+        async with self._session() as s:
             async with s.put(
                 f"{self.api_url}/event-groups/{event_group_id}/schedule.ics",
                 data=data,
@@ -171,6 +194,16 @@ async def update_inh_event_groups(
     inh_client: InNoHassleEventsClient,
     mount_point: pathlib.Path,
     output: Output,
+) -> dict:
+    # one connection pool for the batch request and all uploads instead of a new session per request
+    async with inh_client.shared_session():
+        return await _update_inh_event_groups(inh_client, mount_point, output)
+
+
+async def _update_inh_event_groups(
+    inh_client: InNoHassleEventsClient,
+    mount_point: pathlib.Path,
+    output: Output,
 ) -> dict:
     logger.info(f"Trying to create or read {len(output.event_groups)} event groups")
     inh_event_groups = await inh_client.batch_create_or_read_event_groups(output.event_groups)
@@ -1,38 +1,27 @@
+import json
 from pathlib import Path
 
-from pydantic import BaseModel
-
-
-class User(BaseModel):
-    email: str
-    groups: list[str]
-
-
-class Data(BaseModel):
-    __root__: list[User]
-
 
 def main():
     user_data_file = Path("innopolis_user_data.json")
 
+    # plain dicts, validating every user with a model is not needed to merge groups
     with open(user_data_file) as f:
-        data = Data.parse_raw(f.read())
+        data: list[dict] = json.load(f)
 
     # merge duplicates and drop "" groups
-    users = {}
-    for user in data.__root__:
-        if user.email in users:
-            users[user.email].groups.extend(user.groups)
+    users: dict[str, dict] = {}
+    for user in data:
+        if user["email"] in users:
+            users[user["email"]]["groups"].extend(user["groups"])
         else:
-            users[user.email] = user
+            users[user["email"]] = {"email": user["email"], "groups": list(user["groups"])}
 
     for user in users.values():
-        user.groups = list(set(user.groups) - {""})
-
-    data = Data.parse_obj(list(users.values()))
+        user["groups"] = list(set(user["groups"]) - {""})
 
     with open(user_data_file, "w") as f:
-        f.write(data.json(indent=2))
+        f.write(json.dumps(list(users.values()), indent=2))
 
 
 if __name__ == "__main__":
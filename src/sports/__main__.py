@@ -1,24 +1,25 @@
 import asyncio
 import json
 import os
-from itertools import groupby
 from pathlib import Path
 
 import aiohttp
+import icalendar
 
-from src.config_base import SaveConfig, from_yaml
+from src.config_base import SaveConfig, load_yaml
 from src.innohassle import CreateEventGroup, CreateTag, InNoHassleEventsClient, Output, update_inh_event_groups
 from src.logging_ import logger
 from src.sports.config import SportsParserConfig
 from src.sports.models import SportScheduleEvent
 from src.sports.parser import SportParser
-from src.utils import get_base_calendar, sluggify
+from src.utils import get_base_calendar, group_by, sluggify, write_calendars
 
 
 async def main():
     config_path = Path(__file__).parent / "config.yaml"
-    parser_config = from_yaml(SportsParserConfig, config_path)
-    save_config = from_yaml(SaveConfig, config_path)
+    yaml_config = load_yaml(config_path)
+    parser_config = SportsParserConfig.model_validate(yaml_config)
+    save_config = SaveConfig.model_validate(yaml_config)
     async with aiohttp.ClientSession(headers={"Content-Type": "application/json"}) as session:
         parser = SportParser(session, parser_config)
 
@@ -39,7 +40,7 @@ async def main():
     logger.info(f"Processed {len(sport_events)} sport events")
 
     grouping = lambda x: (x.sport.name, x.sport_schedule_event.title or "")  # noqa: E731
-    sport_events.sort(key=grouping)
+    sport_events_by_group = group_by(grouping, sport_events)
 
     event_groups = []
 
@@ -51,7 +52,8 @@ async def main():
 
     sport_tag = CreateTag(alias="sports", type="category", name="Sport")
 
-    for (title, subtitle), events in groupby(sport_events, key=grouping):
+    calendars_to_write: list[tuple[Path, icalendar.Calendar]] = []
+    for (title, subtitle), events in sorted(sport_events_by_group.items()):
         calendar = get_base_calendar()
 
         calendar_name = f"{title} - {subtitle}" if subtitle else title
@@ -77,15 +79,16 @@ async def main():
             )
         )
         os.makedirs(file_path.parent, exist_ok=True)
-        with open(file_path, "wb") as file:
-            file.write(calendar.to_ical())
+        calendars_to_write.append((file_path, calendar))
+
+    write_calendars(calendars_to_write)
 
     output = Output(event_groups=event_groups, tags=[sport_tag])
 
     logger.debug(f"Saving calendars information to {json_file}")
     os.makedirs(json_file.parent, exist_ok=True)
     with open(json_file, "w") as f:
-        json.dump(output.model_dump(), f, indent=2, sort_keys=False, ensure_ascii=False)
+        f.write(json.dumps(output.model_dump(), indent=2, sort_keys=False, ensure_ascii=False))
 
     # InNoHassle integration
     if save_config.innohassle_api_url is None or save_config.parser_auth_key is None:
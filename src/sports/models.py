@@ -1,11 +1,12 @@
 import datetime
 from enum import StrEnum
+from functools import cache, cached_property
 from zlib import crc32
 
 import icalendar
 from pydantic import BaseModel, RootModel
 
-from src.utils import MOSCOW_TZ, get_color, nearest_weekday
+from src.utils import MOSCOW_TZ, get_color, nearest_weekday, parse_time
 
 
 class ResponseSports(BaseModel):
@@ -72,11 +73,30 @@ class VDayOfWeek(StrEnum):
         return list(cls.__members__.values())[idx]
 
 
+@cache
+def get_weekly_rrule(days_of_week: tuple[int, ...], very_last_date: datetime.date) -> icalendar.vRecur:
+    """
+    Weekly recurrence rule on the given days, built once and shared by all events with the same days
+
+    :param days_of_week: days of week, 1 is Monday
+    :param very_last_date: last date of recurrence
+    :return: recurrence rule
+    """
+    very_last_date_dt = datetime.datetime.combine(very_last_date, datetime.time.min, tzinfo=datetime.UTC)
+    return icalendar.vRecur(
+        {
+            "freq": "weekly",
+            "until": very_last_date_dt,
+            "byday": [icalendar.vWeekday(VDayOfWeek.get_by_index(day - 1)) for day in days_of_week],
+        }
+    )
+
+
 class SportScheduleEvent(BaseModel):
     sport: ResponseSports.Sport
     sport_schedule_event: SportScheduleEventResponse
 
-    @property
+    @cached_property
     def summary(self) -> str:
         title = self.sport.name
         if subtitle := self.sport_schedule_event.title:
@@ -89,13 +109,14 @@ class SportScheduleEvent(BaseModel):
 
     @property
     def start(self) -> datetime.time:
-        return datetime.datetime.strptime(self.sport_schedule_event.startTime, "%H:%M:%S").time()
+        return parse_time(self.sport_schedule_event.startTime, "%H:%M:%S")
 
     @property
     def end(self) -> datetime.time:
-        return datetime.datetime.strptime(self.sport_schedule_event.endTime, "%H:%M:%S").time()
+        return parse_time(self.sport_schedule_event.endTime, "%H:%M:%S")
 
     def __hash__(self):
+        # uid is derived from this hash, so it must be stable between runs: builtin hash() of str is salted
         string_to_hash = str(
             (
                 self.sport.id,
@@ -114,7 +135,7 @@ class SportScheduleEvent(BaseModel):
         """
         return f"{abs(hash(self)):x}@innohassle.ru"
 
-    @property
+    @cached_property
     def description(self) -> str:
         """
         Description of the event
@@ -125,7 +146,7 @@ class SportScheduleEvent(BaseModel):
 
         r = {
             "Location": self.location,
-            "Time": f"{self.start.strftime('%H:%M')} - {self.end.strftime('%H:%M')}",
+            "Time": f"{self.start.hour:02d}:{self.start.minute:02d} - {self.end.hour:02d}:{self.end.minute:02d}",
             "Special": self.sport.special if self.sport.special else None,
         }
 
@@ -149,16 +170,7 @@ class SportScheduleEvent(BaseModel):
         )
         dtstart = datetime.datetime.combine(starting, self.start, tzinfo=MOSCOW_TZ)
         dtend = datetime.datetime.combine(starting, self.end, tzinfo=MOSCOW_TZ)
-        very_last_date_dt = datetime.datetime.combine(very_last_date, datetime.time.min, tzinfo=datetime.UTC)
-        vevent["rrule"] = icalendar.vRecur(
-            {
-                "freq": "weekly",
-                "until": very_last_date_dt,
-                "byday": [
-                    icalendar.vWeekday(VDayOfWeek.get_by_index(day - 1)) for day in self.sport_schedule_event.daysOfWeek
-                ],
-            }
-        )
+        vevent["rrule"] = get_weekly_rrule(tuple(self.sport_schedule_event.daysOfWeek), very_last_date)
 
         vevent["dtstart"] = icalendar.vDatetime(dtstart)
         vevent["dtend"] = icalendar.vDatetime(dtend)
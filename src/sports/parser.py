@@ -9,16 +9,19 @@ from src.sports.models import ResponseSports, ResponseSportSchedule
 
 
 class SportParser:
-    def __init__(self, session: aiohttp.ClientSession, config: SportsParserConfig):
+    def __init__(self, session: aiohttp.ClientSession, config: SportsParserConfig, max_concurrency: int = 8):
         self.session = session
         self.config = config
+        # schedules of all sports are requested at once, keep the number of in-flight requests to the server bounded
+        self._semaphore = asyncio.Semaphore(max_concurrency)
 
     async def get_sports(self) -> ResponseSports:
         url = f"{self.config.api_url}/sports"
         logger.debug(f"Getting sports from {url}")
         async with self.session.get(url) as response:
-            text = await response.text()
-            response_schema = ResponseSports.parse_raw(text)
+            # pydantic parses and validates raw bytes in one pass, no need to decode to str first
+            content = await response.read()
+            response_schema = ResponseSports.model_validate_json(content)
             logger.debug(f"Got {len(response_schema.sports)} sports")
             return response_schema
 
@@ -27,9 +30,9 @@ class SportParser:
         final = self.config.end_of_semester.strftime("%Y-%m-%d")
         url = f"{self.config.api_url}/calendar/{sport_id}/schedule?start={start}T00%3A00&end={final}T00%3A00"
         logger.debug(f"Getting sport schedule from {url}")
-        async with self.session.get(url) as response:
-            text = await response.text()
-            response_schema = ResponseSportSchedule.model_validate_json(text)
+        async with self._semaphore, self.session.get(url) as response:
+            content = await response.read()
+            response_schema = ResponseSportSchedule.model_validate_json(content)
             logger.debug(f"Got {len(response_schema.root)} events")
             return response_schema
 
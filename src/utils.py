@@ -6,12 +6,18 @@ https://github.com/one-zero-eight/schedule-builder-backend/blob/main/src/parsers
 
 __all__ = [
     "nearest_weekday",
+    "parse_time",
     "WEEKDAYS",
+    "WEEKDAYS_SET",
     "TIMEZONE",
     "WEEKDAYS",
     "sluggify",
     "get_color",
     "get_base_calendar",
+    "write_calendar",
+    "write_calendars",
+    "group_by",
+    "WorkbookLoader",
     "remove_repeating_spaces_and_trailing_spaces",
     "set_one_space_around_brackets_and_remove_repeating_brackets",
     "set_one_space_after_comma_and_remove_repeating_commas",
@@ -19,17 +25,38 @@ __all__ = [
 ]
 
 import datetime
+import functools
 import hashlib
 import io
 import re
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
 from enum import StrEnum
+from pathlib import Path
+from typing import TYPE_CHECKING
 
-import httpx
 import icalendar
 
+if TYPE_CHECKING:
+    import openpyxl
+
 TIMEZONE = "Europe/Moscow"
 MOSCOW_TZ = datetime.timezone(datetime.timedelta(hours=3), name="Europe/Moscow")
 WEEKDAYS = ["MONDAY", "TUESDAY", "WEDNESDAY", "THURSDAY", "FRIDAY", "SATURDAY", "SUNDAY"]
+WEEKDAYS_SET = frozenset(WEEKDAYS)
+
+REPEATING_SPACES_PATTERN = re.compile(r"\s{2,}")
+REPEATING_OPENING_BRACKETS_PATTERN = re.compile(r"(\(\s*)+\(")
+REPEATING_CLOSING_BRACKETS_PATTERN = re.compile(r"(\)\s*)+\)")
+SPACES_AROUND_OPENING_BRACKET_PATTERN = re.compile(r"\s*\([ \t]*")
+SPACES_AROUND_CLOSING_BRACKET_PATTERN = re.compile(r"\s*\)[ \t]+")
+REPEATING_COMMAS_PATTERN = re.compile(r"(\,\s*)+\,")
+SPACES_AROUND_COMMA_PATTERN = re.compile(r"\s*\,\s*")
+SHEET_NAME_FORBIDDEN_CHARS_PATTERN = re.compile(r"[/\\?*\[\]:]")
+SLUG_FORBIDDEN_CHARS_PATTERN = re.compile(r"[^a-z0-9а-яА-ЯёЁ\s-]")
+WHITESPACES_PATTERN = re.compile(r"\s+")
+REPEATING_DASHES_PATTERN = re.compile(r"-{2,}")
 
 
 async def fetch_xlsx_spreadsheet(spreadsheet_id: str) -> io.BytesIO:
@@ -40,6 +67,9 @@ async def fetch_xlsx_spreadsheet(spreadsheet_id: str) -> io.BytesIO:
     :return: xlsx file as BytesIO object
     """
 
+    # imported lazily, modules using only string helpers should not pay for httpx
+    import httpx
+
     spreadsheet_url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}"
     export_url = spreadsheet_url + "/export?format=xlsx"
 
@@ -56,6 +86,8 @@ async def get_sheet_gids(spreadsheet_id: str) -> dict[str, str]:
     :param spreadsheet_id: id of Google Sheets spreadsheet
     :return: mapping of sheet name to gid
     """
+    import httpx
+
     url = f"https://docs.google.com/spreadsheets/d/{spreadsheet_id}/htmlview"
     async with httpx.AsyncClient() as client:
         response = await client.get(url, follow_redirects=True)
@@ -74,6 +106,42 @@ async def get_sheet_gids(spreadsheet_id: str) -> dict[str, str]:
         return sheet_mappings
 
 
+class WorkbookLoader:
+    """
+    Load workbook from xlsx file only once per file, as every sheet is inspected through it.
+    Each parser owns its loader, so the workbook is freed together with the parser.
+    """
+
+    def __init__(self):
+        self._xlsx_file: io.BytesIO | None = None
+        self._workbook: openpyxl.Workbook | None = None
+
+    def __call__(self, xlsx_file: io.BytesIO) -> "openpyxl.Workbook":
+        """
+        :param xlsx_file: xlsx file with data
+        :return: loaded workbook
+        """
+        if self._workbook is None or self._xlsx_file is not xlsx_file:
+            import openpyxl
+
+            xlsx_file.seek(0)
+            self._xlsx_file, self._workbook = xlsx_file, openpyxl.load_workbook(xlsx_file)
+        return self._workbook
+
+
+@functools.cache
+def parse_time(string: str, format: str = "%H:%M") -> datetime.time:
+    """
+    Parse time string, cached as only a few distinct times repeat over the whole schedule
+
+    :param string: time string, e.g. "9:00"
+    :param format: strptime format, defaults to "%H:%M"
+    :return: parsed time
+    :rtype: datetime.time
+    """
+    return datetime.datetime.strptime(string, format).time()
+
+
 def nearest_weekday(date: datetime.date, day: int | str) -> datetime.date:
     """
     Returns the date of the next given weekday after
@@ -105,7 +173,7 @@ def sanitize_sheet_name(name: str) -> str:
         return "Sheet1"
 
     name = name.strip()
-    name = re.sub(r"[/\\?*\[\]:]", "", name)
+    name = SHEET_NAME_FORBIDDEN_CHARS_PATTERN.sub("", name)
     name = name.strip("'")
 
     if len(name) > 31:
@@ -128,10 +196,10 @@ def sluggify(s: str) -> str:
     """
     s = s.lower()
     # also translates special symbols, brackets, commas, etc.
-    s = re.sub(r"[^a-z0-9а-яА-ЯёЁ\s-]", " ", s)
-    s = re.sub(r"\s+", "-", s)
+    s = SLUG_FORBIDDEN_CHARS_PATTERN.sub(" ", s)
+    s = WHITESPACES_PATTERN.sub("-", s)
     # remove multiple dashes
-    s = re.sub(r"-{2,}", "-", s)
+    s = REPEATING_DASHES_PATTERN.sub("-", s)
     # remove leading and trailing dashes
     s = s.strip("-")
     return s
@@ -192,6 +260,18 @@ def get_base_calendar() -> icalendar.Calendar:
     calendar["x-wr-timezone"] = TIMEZONE
 
     # add timezone
+    calendar.add_component(get_timezone_component())
+
+    return calendar
+
+
+@functools.cache
+def get_timezone_component() -> icalendar.Timezone:
+    """
+    Get VTIMEZONE component for Moscow, built once and shared by all calendars as it is never modified
+    :return: timezone component
+    :rtype: icalendar.Timezone
+    """
     timezone = icalendar.Timezone(tzid=TIMEZONE)
     timezone["x-lic-location"] = TIMEZONE
     # add standard timezone
@@ -201,13 +281,56 @@ def get_base_calendar() -> icalendar.Calendar:
     standard.add("tzname", "MSK")
     standard.add("dtstart", datetime.datetime(1970, 1, 1))
     timezone.add_component(standard)
-    calendar.add_component(timezone)
+    return timezone
 
-    return calendar
+
+def write_calendar(file_path: Path, calendar: icalendar.Calendar) -> None:
+    """
+    Serialize calendar and write it to .ics file
+
+    :param file_path: path to .ics file
+    :type file_path: Path
+    :param calendar: calendar to write
+    :type calendar: icalendar.Calendar
+    """
+    content = calendar.to_ical()
+    # TODO: add validation
+    file_path.write_bytes(content)
+
+
+def write_calendars(calendars: Iterable[tuple[Path, icalendar.Calendar]]) -> None:
+    """
+    Write calendars to .ics files in a thread pool, calendars are independent so serialization and writing overlap
+
+    :param calendars: pairs of path to .ics file and calendar to write
+    :type calendars: Iterable[tuple[Path, icalendar.Calendar]]
+    """
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        # consume results to re-raise errors from workers
+        for _ in pool.map(lambda args: write_calendar(*args), calendars):
+            pass
+
+
+def group_by[K, T](key: Callable[[T], K], items: Iterable[T]) -> dict[K, list[T]]:
+    """
+    Group items by key in one pass, unlike itertools.groupby items do not have to be sorted first
+
+    :param key: function returning group key of item
+    :param items: items to group
+    :return: mapping of key to items of the group in their original order
+    """
+    groups: dict[K, list[T]] = defaultdict(list)
+    for item in items:
+        groups[key(item)].append(item)
+    return groups
 
 
 def remove_repeating_spaces_and_trailing_spaces(s: str) -> str:
-    return re.sub(r"\s{2,}", " ", s).strip()
+    # printable strings have no whitespace but " ", so split and join gives the same result without regex
+    if s.isprintable():
+        return " ".join(s.split())
+    # single newlines and tabs are kept, e.g. electives cells are split by lines later
+    return REPEATING_SPACES_PATTERN.sub(" ", s).strip()
 
 
 def set_one_space_around_brackets_and_remove_repeating_brackets(s: str) -> str:
@@ -219,13 +342,19 @@ def set_one_space_around_brackets_and_remove_repeating_brackets(s: str) -> str:
     :return: prettified string
     :rtype: str
     """
+    # substitutions never add or remove a kind of bracket, skip the scans for strings without it
+    has_opening, has_closing = "(" in s, ")" in s
     # remove multiple brackets in a row
-    s = re.sub(r"(\(\s*)+\(", "(", s)
-    s = re.sub(r"(\)\s*)+\)", ")", s)
+    if has_opening:
+        s = REPEATING_OPENING_BRACKETS_PATTERN.sub("(", s)
+    if has_closing:
+        s = REPEATING_CLOSING_BRACKETS_PATTERN.sub(")", s)
 
     # set only one space after and before brackets except for brackets in the end of string
-    s = re.sub(r"\s*\([ \t]*", " (", s)
-    s = re.sub(r"\s*\)[ \t]+", ") ", s)
+    if has_opening:
+        s = SPACES_AROUND_OPENING_BRACKET_PATTERN.sub(" (", s)
+    if has_closing:
+        s = SPACES_AROUND_CLOSING_BRACKET_PATTERN.sub(") ", s)
     s = s.strip()
     return s
 
@@ -239,10 +368,11 @@ def set_one_space_after_comma_and_remove_repeating_commas(s: str) -> str:
     :return: prettified string
     :rtype: str
     """
-    # remove multiple commas in a row
-    s = re.sub(r"(\,\s*)+\,", ",", s)
-    # set only one space after and before commas except for commas in the end of string
-    s = re.sub(r"\s*\,\s*", ", ", s)
+    if "," in s:
+        # remove multiple commas in a row
+        s = REPEATING_COMMAS_PATTERN.sub(",", s)
+        # set only one space after and before commas except for commas in the end of string
+        s = SPACES_AROUND_COMMA_PATTERN.sub(", ", s)
     s = s.strip()
     return s
 
@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.core_courses.parser import CoreCoursesParser
+
+cases = [
+    (
+        "adjacent runs",
+        [
+            ("MONDAY", "09:00-10:30"),
+            ("MONDAY", "09:00-10:30"),
+            ("MONDAY", "09:00-10:30"),
+            ("MONDAY", "10:40-12:10"),
+            ("MONDAY", "10:40-12:10"),
+            ("TUESDAY", "09:00-10:30"),
+        ],
+    ),
+    (
+        "non-adjacent repeated keys",
+        [
+            ("MONDAY", "09:00-10:30"),
+            ("MONDAY", "10:40-12:10"),
+            ("MONDAY", "09:00-10:30"),
+            ("TUESDAY", "09:00-10:30"),
+        ],
+    ),
+    (
+        "nan time codes",
+        [
+            ("MONDAY", "09:00-10:30"),
+            ("MONDAY", np.nan),
+            ("MONDAY", "10:40-12:10"),
+            ("TUESDAY", np.nan),
+        ],
+    ),
+]
+
+
+@pytest.mark.parametrize("index", [index for _, index in cases], ids=[name for name, _ in cases])
+def test_group_by_weekday_and_time(index: list[tuple[str, str]]):
+    df = pd.DataFrame(
+        [[f"subject {i}", None] for i in range(len(index))],
+        index=pd.MultiIndex.from_tuples(index),
+        columns=["B25-AI-01", "B25-AI-02"],
+        dtype=object,
+    )
+    desired = df.groupby(level=[0, 1], sort=False).agg(list)
+    pd.testing.assert_frame_equal(CoreCoursesParser().group_by_weekday_and_time(df), desired)
@@ -0,0 +1,17 @@
+import pytest
+
+from src.core_courses.cell_to_event import preprocess_group
+
+cases = [
+    ("M21-DS(16)", ("M21-DS", 16)),
+    ("M22-TE-01 (10)", ("M22-TE-01", 10)),
+    ("B20-SD-02 (29)", ("B20-SD-02", 29)),
+    ("B25-AI-01 (G1)", ("B25-AI-01", 1)),
+    ("M25-RO-01", ("M25-RO-01", None)),
+    ("B25-AI-30 (30)", ("B25-AI-30", 30)),
+]
+
+
+@pytest.mark.parametrize("input_, desired", cases, ids=[x for x, _ in cases])
+def test_preprocess_group(input_: str, desired: tuple[str, int | None]):
+    assert preprocess_group(input_) == desired
@@ -0,0 +1,17 @@
+import pytest
+
+from src.utils import prettify_string
+
+cases = [
+    ("Mathematical  Analysis I  (lec)", "Mathematical Analysis I (lec)"),
+    ("  Ivan Ivanov ", "Ivan Ivanov"),
+    ("301,,  302", "301, 302"),
+    ("((lec))", "(lec)"),
+    ("Elective A 301\nElective B  302", "Elective A 301\nElective B 302"),
+    ("Elective A 301 \n\n Elective B 302", "Elective A 301 Elective B 302"),
+]
+
+
+@pytest.mark.parametrize("input_, desired", cases, ids=[x for x, _ in cases])
+def test_prettify_string(input_: str, desired: str):
+    assert prettify_string(input_) == desired